@@ -1,4 +1,5 @@
 import wx
+import threading
 from radio_api import RadioBrowserAPI, RadioStation
 from StreamChecker import StreamChecker
 class AddStationDialog(wx.Dialog):
@@ -15,9 +16,9 @@ class AddStationDialog(wx.Dialog):
         sizer.Add(wx.StaticText(panel, label = "Custom station name"), 0, wx.ALL, 5)
         self.station_name_textCTRL = wx.TextCtrl(panel, value = self.custom_name)
         sizer.Add(self.station_name_textCTRL, 0, wx.ALL, 5)
-        check_btn = wx.Button(panel, label = "&Check stream")
-        check_btn.Bind(wx.EVT_BUTTON, self.on_check)
-        sizer.Add(check_btn, 0, wx.ALL, 5)
+        self.check_btn = wx.Button(panel, label = "&Check stream")
+        self.check_btn.Bind(wx.EVT_BUTTON, self.on_check)
+        sizer.Add(self.check_btn, 0, wx.ALL, 5)
         button_sizer = wx.StdDialogButtonSizer()
         ok_btn = wx.Button(panel, wx.ID_OK)
         ok_btn.Bind(wx.EVT_BUTTON, self.on_ok)
@@ -28,17 +29,31 @@ class AddStationDialog(wx.Dialog):
         button_sizer.Realize()
         sizer.Add(button_sizer, 0, wx.ALL | wx.EXPAND, 5)
     def on_check(self, event):
-        checker = StreamChecker()
         self.url = self.url_text_box.GetValue()
-        result= checker.is_valid_stream(self.url)
+        self.check_btn.Enable(False)
+        # Checking can take several seconds, keep the UI responsive meanwhile
+        t = threading.Thread(target=self._bg_check, args=(self.url,))
+        t.daemon = True
+        t.start()
+        event.Skip()
+    def _bg_check(self, url):
+        checker = StreamChecker()
+        result = checker.is_valid_stream(url)
+        wx.CallAfter(self._on_check_done, url, result)
+    def _on_check_done(self, url, result):
+        # A destroyed dialog is falsy; after Cancel or OK nobody is waiting for the answer
+        if not self or not self.IsModal():
+            return
+        self.check_btn.Enable(True)
+        # The URL was edited during the check, so the result is about another stream
+        if url != self.url_text_box.GetValue():
+            return
         if result['valid']:
             self.is_stream_checked = True
-            message = f"{result.__str__()}"
-            wx.MessageBox(f"Stream is valid! {message}", "Success", wx.OK | wx.ICON_INFORMATION)
+            wx.MessageBox(f"Stream is valid! ({result.get('stream_type') or 'unknown type'})", "Success", wx.OK | wx.ICON_INFORMATION)
         else:
             self.is_stream_checked = False
             wx.MessageBox("Stream is not valid. Please check the URL and try again.", "Error", wx.OK | wx.ICON_ERROR)
-        event.Skip()
     def on_ok(self, event):
         if not self.is_stream_checked:
             wx.MessageBox("Please check the stream before adding the station.", "Warning", wx.OK | wx.ICON_WARNING)
@@ -2,11 +2,28 @@ import wx
 import wx.adv
 
 class SettingsDialog(wx.Dialog):
+    # Kept alive between openings so the widget tree is only built once
+    _instance = None
+    
+    @classmethod
+    def open(cls, parent, settings):
+        """Return the shared dialog for parent, refreshed from settings."""
+        # A destroyed wx window evaluates to False
+        if not cls._instance or cls._instance.GetParent() is not parent:
+            cls._instance = cls(parent, settings)
+        else:
+            cls._instance._load(settings)
+        return cls._instance
+    
     def __init__(self, parent, settings):
         super().__init__(parent, title="Settings", size=(500, 400))
         
-        self.settings = settings.copy()
-        
+        self._build()
+        self._load(settings)
+        self.Centre()
+    
+    def _build(self):
+        """Create the dialog's widgets."""
         panel = wx.Panel(self)
         sizer = wx.BoxSizer(wx.VERTICAL)
         
@@ -15,16 +32,17 @@ class SettingsDialog(wx.Dialog):
         rec_sizer = wx.StaticBoxSizer(rec_box, wx.VERTICAL)
         
         rec_dir_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        rec_dir_sizer.Add(wx.StaticText(panel, label="Directory:"), 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-        self.rec_dir_text = wx.TextCtrl(panel, value=self.settings.get('recording_dir', ''))
-        rec_dir_sizer.Add(self.rec_dir_text, 1, wx.ALL, 5)
-        
+        rec_dir_label = wx.StaticText(panel, label="Directory:")
+        self.rec_dir_text = wx.TextCtrl(panel)
         browse_btn = wx.Button(panel, label="Browse...")
         browse_btn.Bind(wx.EVT_BUTTON, self.on_browse_dir)
-        rec_dir_sizer.Add(browse_btn, 0, wx.ALL, 5)
+        rec_dir_sizer.AddMany([
+            (rec_dir_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5),
+            (self.rec_dir_text, 1, wx.ALL, 5),
+            (browse_btn, 0, wx.ALL, 5)
+        ])
         
         rec_sizer.Add(rec_dir_sizer, 0, wx.EXPAND)
-        sizer.Add(rec_sizer, 0, wx.ALL|wx.EXPAND, 5)
         
         # Data source
         source_box = wx.StaticBox(panel, label="Data Source")
@@ -33,45 +51,41 @@ class SettingsDialog(wx.Dialog):
         self.rb_radiobrowser = wx.RadioButton(panel, label="Radio Browser", style=wx.RB_GROUP)
         self.rb_onlineradiobox = wx.RadioButton(panel, label="Online Radio Box (experimental)")
         
-        if self.settings.get('source', 'radiobrowser') == 'radiobrowser':
-            self.rb_radiobrowser.SetValue(True)
-        else:
-            self.rb_onlineradiobox.SetValue(True)
-        
-        source_sizer.Add(self.rb_radiobrowser, 0, wx.ALL, 5)
-        source_sizer.Add(self.rb_onlineradiobox, 0, wx.ALL, 5)
-        sizer.Add(source_sizer, 0, wx.ALL|wx.EXPAND, 5)
+        source_sizer.AddMany([
+            (self.rb_radiobrowser, 0, wx.ALL, 5),
+            (self.rb_onlineradiobox, 0, wx.ALL, 5)
+        ])
         
         # Playback
         playback_box = wx.StaticBox(panel, label="Playback")
         playback_sizer = wx.StaticBoxSizer(playback_box, wx.VERTICAL)
         
         self.autoplay_cb = wx.CheckBox(panel, label="Auto-play on selection")
-        self.autoplay_cb.SetValue(self.settings.get('autoplay', False))
-        playback_sizer.Add(self.autoplay_cb, 0, wx.ALL, 5)
         
         buffer_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        buffer_sizer.Add(wx.StaticText(panel, label="Buffer size (ms):"), 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-        self.buffer_spin = wx.SpinCtrl(panel, value=str(self.settings.get('buffer_size', 1000)), 
-                                        min=500, max=5000, initial=self.settings.get('buffer_size', 1000))
-        buffer_sizer.Add(self.buffer_spin, 0, wx.ALL, 5)
-        playback_sizer.Add(buffer_sizer, 0, wx.EXPAND)
-        
-        sizer.Add(playback_sizer, 0, wx.ALL|wx.EXPAND, 5)
+        buffer_label = wx.StaticText(panel, label="Buffer size (ms):")
+        self.buffer_spin = wx.SpinCtrl(panel, min=500, max=5000, initial=1000)
+        buffer_sizer.AddMany([
+            (buffer_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5),
+            (self.buffer_spin, 0, wx.ALL, 5)
+        ])
+        playback_sizer.AddMany([
+            (self.autoplay_cb, 0, wx.ALL, 5),
+            (buffer_sizer, 0, wx.EXPAND)
+        ])
         
         # Updates
         update_box = wx.StaticBox(panel, label="Updates")
         update_sizer = wx.StaticBoxSizer(update_box, wx.VERTICAL)
         
         self.check_updates_cb = wx.CheckBox(panel, label="Check for updates on startup")
-        self.check_updates_cb.SetValue(self.settings.get('check_updates', True))
-        update_sizer.Add(self.check_updates_cb, 0, wx.ALL, 5)
         
         check_now_btn = wx.Button(panel, label="Check for Updates Now")
         check_now_btn.Bind(wx.EVT_BUTTON, self.on_check_updates)
-        update_sizer.Add(check_now_btn, 0, wx.ALL, 5)
-        
-        sizer.Add(update_sizer, 0, wx.ALL|wx.EXPAND, 5)
+        update_sizer.AddMany([
+            (self.check_updates_cb, 0, wx.ALL, 5),
+            (check_now_btn, 0, wx.ALL, 5)
+        ])
         
         # Buttons
         btn_sizer = wx.StdDialogButtonSizer()
@@ -82,10 +96,28 @@ class SettingsDialog(wx.Dialog):
         btn_sizer.AddButton(cancel_btn)
         btn_sizer.Realize()
         
-        sizer.Add(btn_sizer, 0, wx.ALL|wx.EXPAND, 5)
+        sizer.AddMany([
+            (rec_sizer, 0, wx.ALL|wx.EXPAND, 5),
+            (source_sizer, 0, wx.ALL|wx.EXPAND, 5),
+            (playback_sizer, 0, wx.ALL|wx.EXPAND, 5),
+            (update_sizer, 0, wx.ALL|wx.EXPAND, 5),
+            (btn_sizer, 0, wx.ALL|wx.EXPAND, 5)
+        ])
         
         panel.SetSizer(sizer)
-        self.Centre()
+    
+    def _load(self, settings):
+        """Refresh the widgets from settings."""
+        self.settings = settings.copy()
+        
+        self.rec_dir_text.SetValue(self.settings.get('recording_dir', ''))
+        if self.settings.get('source', 'radiobrowser') == 'radiobrowser':
+            self.rb_radiobrowser.SetValue(True)
+        else:
+            self.rb_onlineradiobox.SetValue(True)
+        self.autoplay_cb.SetValue(self.settings.get('autoplay', False))
+        self.buffer_spin.SetValue(self.settings.get('buffer_size', 1000))
+        self.check_updates_cb.SetValue(self.settings.get('check_updates', True))
     
     def on_browse_dir(self, event):
         dlg = wx.DirDialog(self, "Choose recording directory", 
@@ -1,8 +1,106 @@
 import requests
+from requests.adapters import HTTPAdapter
+import ssl
 import urllib.parse
 from typing import Dict, Tuple, Optional
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# Connections kept per host; also the number of concurrent checks we run
+_POOL_MAXSIZE = 20
+
+# Built once so the system CA bundle is only loaded a single time per process
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.set_alpn_protocols(['http/1.1'])
+
+
+class _SharedSSLAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools all use the preloaded SSL context."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = _SSL_CONTEXT
+        return super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs['ssl_context'] = _SSL_CONTEXT
+        return super().proxy_manager_for(*args, **kwargs)
+
+
+# Shared across all StreamChecker instances so repeated checks reuse pooled connections
+# urllib3 host pools hand out the most recently returned (still warm) socket first;
+# pool_block=False lets bursts above the pool size open extra connections instead of waiting
+_ADAPTER = _SharedSSLAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE, pool_block=False, max_retries=0)
+
+
+@lru_cache(maxsize=None)
+def _session(max_redirects: int) -> requests.Session:
+    """
+    Session following at most max_redirects redirects.
+    
+    The redirect limit is a session setting, so each limit gets its own
+    session; the connection pools live in _ADAPTER and are shared by all.
+    """
+    session = requests.Session()
+    session.mount('http://', _ADAPTER)
+    session.mount('https://', _ADAPTER)
+    session.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; StreamChecker/1.0)'})
+    session.max_redirects = max_redirects
+    return session
+
+
+# Common streaming MIME types
+STREAM_CONTENT_TYPES = frozenset({
+    'audio/mpeg', 'audio/mp3', 'audio/aac', 'audio/aacp',
+    'audio/ogg', 'audio/opus', 'audio/flac', 'audio/wav',
+    'audio/x-wav', 'audio/wave', 'audio/vnd.wave',
+    'audio/mp4', 'audio/x-m4a', 'audio/webm',
+    'video/mp4', 'video/webm', 'video/ogg', 'video/x-flv',
+    'video/mp2t', 'video/3gpp', 'video/quicktime',
+    'application/vnd.apple.mpegurl', 'application/x-mpegurl',
+    'application/dash+xml', 'application/octet-stream'
+})
+
+# Streaming file extensions
+STREAM_EXTENSIONS = frozenset({
+    '.m3u', '.m3u8', '.pls', '.asx', '.xspf',
+    '.mp3', '.aac', '.ogg', '.flac', '.wav',
+    '.mp4', '.webm', '.flv', '.ts', '.m4a'
+})
+
+# Playlist MIME types; these are small text files, so there is no stream data to probe
+PLAYLIST_CONTENT_TYPES = {
+    'application/vnd.apple.mpegurl': 'HLS playlist',
+    'application/x-mpegurl': 'HLS playlist',
+    'audio/x-mpegurl': 'HLS playlist',
+    'audio/mpegurl': 'HLS playlist',
+    'audio/x-scpls': 'PLS playlist'
+}
+
+# Stream types (from URL extension) that are playlists rather than media
+PLAYLIST_STREAM_TYPES = frozenset({'HLS playlist', 'PLS playlist'})
+
+# Leading bytes of common audio containers (MP3/AAC sync, ID3, Ogg, FLAC, WAV)
+AUDIO_MAGIC_PREFIXES = (b'\xff', b'ID3', b'OggS', b'fLaC', b'RIFF')
+
+# Stream type reported for each recognised extension
+EXTENSION_STREAM_TYPES = {
+    '.m3u': 'HLS playlist', '.m3u8': 'HLS playlist',
+    '.pls': 'PLS playlist',
+    '.mp3': 'Audio stream', '.aac': 'Audio stream', '.ogg': 'Audio stream',
+    '.flac': 'Audio stream', '.wav': 'Audio stream', '.m4a': 'Audio stream',
+    '.mp4': 'Video stream', '.webm': 'Video stream', '.flv': 'Video stream',
+    '.ts': 'Video stream'
+}
+
+
+@lru_cache(maxsize=2048)
+def _parse_url(url: str) -> urllib.parse.SplitResult:
+    """Parse a URL once; repeated checks of the same URL hit the cache."""
+    return urllib.parse.urlsplit(url)
+
 
 class StreamChecker:
     """
@@ -10,24 +108,18 @@ class StreamChecker:
     Supports audio and video streams in various formats.
     """
     
-    # Common streaming MIME types
-    STREAM_CONTENT_TYPES = {
-        'audio/mpeg', 'audio/mp3', 'audio/aac', 'audio/aacp',
-        'audio/ogg', 'audio/opus', 'audio/flac', 'audio/wav',
-        'audio/x-wav', 'audio/wave', 'audio/vnd.wave',
-        'audio/mp4', 'audio/x-m4a', 'audio/webm',
-        'video/mp4', 'video/webm', 'video/ogg', 'video/x-flv',
-        'video/mp2t', 'video/3gpp', 'video/quicktime',
-        'application/vnd.apple.mpegurl', 'application/x-mpegurl',
-        'application/dash+xml', 'application/octet-stream'
-    }
+    # Module-level tables re-exported for callers that used the class attributes
+    STREAM_CONTENT_TYPES = STREAM_CONTENT_TYPES
+    STREAM_EXTENSIONS = STREAM_EXTENSIONS
     
-    # Streaming file extensions
-    STREAM_EXTENSIONS = {
-        '.m3u', '.m3u8', '.pls', '.asx', '.xspf',
-        '.mp3', '.aac', '.ogg', '.flac', '.wav',
-        '.mp4', '.webm', '.flv', '.ts', '.m4a'
-    }
+    # Validated URLs are remembered for this long (seconds), up to CACHE_SIZE entries
+    CACHE_TTL = 300
+    CACHE_SIZE = 1024
+    
+    # (normalized url, check_playability, timeout, max_redirect) -> (timestamp, result),
+    # shared by all instances; a check with other limits may not pass, so they are part of the key
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
     
     def __init__(self, timeout: int = 10, max_redirect: int = 5):
         """
@@ -39,8 +131,7 @@ class StreamChecker:
         """
         self.timeout = timeout
         self.max_redirect = max_redirect
-        self.session = requests.Session()
-        self.session.max_redirects = max_redirect
+        self.session = _session(max_redirect)
         
     def is_valid_stream(self, url: str, check_playability: bool = True) -> Dict:
         """
@@ -58,6 +149,26 @@ class StreamChecker:
                 - status_code: HTTP status code (if available)
                 - stream_type: Type of stream detected
         """
+        key = (self._normalize_url(url), check_playability, self.timeout, self.max_redirect)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and time.time() - entry[0] < self.CACHE_TTL:
+                self._cache.move_to_end(key)
+                return dict(entry[1])
+        
+        result = self._check_stream(url, check_playability)
+        
+        if result['valid']:
+            with self._cache_lock:
+                self._cache[key] = (time.time(), dict(result))
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        
+        return result
+    
+    def _check_stream(self, url: str, check_playability: bool) -> Dict:
+        """Run the actual validation for is_valid_stream, bypassing the cache."""
         result = {
             'valid': False,
             'reason': '',
@@ -66,35 +177,41 @@ class StreamChecker:
             'stream_type': None
         }
         
-        # Validate URL format
-        if not self._is_valid_url(url):
+        # Validate URL format and check its extension from a single parse
+        is_valid_url, stream_type = self._classify_url(url)
+        if not is_valid_url:
             result['reason'] = 'Invalid URL format'
             return result
         
-        # Check URL extension
-        stream_type = self._check_url_extension(url)
         if stream_type:
             result['stream_type'] = stream_type
-        
-        try:
-            # Send HEAD request first (efficient)
-            head_valid, head_result = self._check_with_head(url)
-            
-            if head_valid:
-                result.update(head_result)
+            # Extension is conclusive, no need to hit the network
+            if not check_playability:
                 result['valid'] = True
+                result['reason'] = 'Valid stream (extension)'
                 return result
+
+        try:
+            # Send HEAD request first (efficient), unless the extension already
+            # told us what this is; many Icecast/Shoutcast servers reject HEAD anyway
+            if not stream_type:
+                try:
+                    with self._request('HEAD', url) as response:
+                        head_valid, head_result = self._evaluate_response(response, check_playability)
+                except requests.exceptions.RequestException:
+                    head_valid = False
+                
+                if head_valid:
+                    result.update(head_result)
+                    result['valid'] = True
+                    return result
             
             # If HEAD fails or is inconclusive, try GET with streaming
-            get_valid, get_result = self._check_with_get(url, check_playability)
-            
-            if get_valid:
-                result.update(get_result)
-                result['valid'] = True
-                return result
+            with self._request('GET', url, stream=True) as response:
+                get_valid, get_result = self._evaluate_response(response, check_playability, stream_type)
             
-            # Merge failure reasons
             result.update(get_result)
+            result['valid'] = get_valid
             
         except requests.exceptions.Timeout:
             result['reason'] = 'Request timeout'
@@ -109,157 +226,162 @@ class StreamChecker:
         
         return result
     
-    def _is_valid_url(self, url: str) -> bool:
-        """Validate URL format."""
+    def _normalize_url(self, url: str) -> str:
+        """Normalize a URL for use as a cache key."""
         try:
-            parsed = urllib.parse.urlparse(url)
-            return bool(parsed.scheme in ['http', 'https'] and parsed.netloc)
-        except Exception:
-            return False
+            parts = _parse_url(url.strip())
+        except ValueError:
+            return url
+        return urllib.parse.urlunsplit(
+            (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, '')
+        )
+    
+    def _classify_url(self, url: str) -> Tuple[bool, Optional[str]]:
+        """
+        Validate URL format and detect a streaming file extension.
+        
+        Returns:
+            Tuple of (URL is a valid http(s) URL, stream type from extension or None)
+        """
+        try:
+            parsed = _parse_url(url)
+        except ValueError:
+            # Only raised for malformed netlocs such as an unclosed IPv6 bracket
+            return False, None
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            return False, None
+        
+        path = parsed.path
+        dot = path.rfind('.')
+        if dot < 0:
+            return True, None
+        return True, EXTENSION_STREAM_TYPES.get(path[dot:].lower())
     
-    def _check_url_extension(self, url: str) -> Optional[str]:
-        """Check if URL has a streaming file extension."""
-        parsed = urllib.parse.urlparse(url)
-        path = parsed.path.lower()
+    def _request(self, method: str, url: str, stream: bool = False) -> requests.Response:
+        """
+        Send a request through the shared session.
         
-        for ext in self.STREAM_EXTENSIONS:
-            if path.endswith(ext):
-                if ext in ['.m3u', '.m3u8']:
-                    return 'HLS playlist'
-                elif ext == '.pls':
-                    return 'PLS playlist'
-                elif ext in ['.mp3', '.aac', '.ogg', '.flac', '.wav', '.m4a']:
-                    return 'Audio stream'
-                elif ext in ['.mp4', '.webm', '.flv', '.ts']:
-                    return 'Video stream'
-        return None
+        Streamed requests get a short read timeout so probing a silent stream
+        cannot block for long. Leaving a with block on the response closes it
+        and hands the connection back to the pool.
+        """
+        return self.session.request(
+            method,
+            url,
+            timeout=(self.timeout, 5) if stream else self.timeout,
+            stream=stream,
+            allow_redirects=True
+        )
     
-    def _check_with_head(self, url: str) -> Tuple[bool, Dict]:
-        """Perform HEAD request to check headers."""
+    def _evaluate_response(self, response: requests.Response, check_playability: bool,
+                           url_stream_type: Optional[str] = None) -> Tuple[bool, Dict]:
+        """
+        Decide whether a HEAD or streamed GET response is a valid stream.
+        
+        Stream data is only read from GET responses. url_stream_type is the
+        type detected from the URL extension, if any; playlists are accepted
+        without reading their body.
+        """
         result = {
             'reason': '',
             'content_type': None,
-            'status_code': None,
+            'status_code': response.status_code,
             'stream_type': None
         }
+        has_body = response.request.method != 'HEAD'
         
-        try:
-            response = self.session.head(
-                url,
-                timeout=self.timeout,
-                allow_redirects=True,
-                headers={'User-Agent': 'Mozilla/5.0 (compatible; StreamChecker/1.0)'}
-            )
-            
-            result['status_code'] = response.status_code
-            
-            if response.status_code != 200:
-                result['reason'] = f'HTTP {response.status_code}'
-                return False, result
-            
-            content_type = response.headers.get('Content-Type', '').lower()
-            result['content_type'] = content_type
-            
-            # Check if content type indicates streaming
-            for stream_type in self.STREAM_CONTENT_TYPES:
-                if stream_type in content_type:
-                    result['reason'] = 'Valid stream (HEAD check)'
-                    result['stream_type'] = self._categorize_stream(content_type)
-                    return True, result
+        if response.status_code != 200:
+            result['reason'] = f'HTTP {response.status_code}'
+            self._drain(response)
+            return False, result
+        
+        content_type = response.headers.get('Content-Type', '').lower()
+        result['content_type'] = content_type
+        
+        # Check for ICY protocol (Shoutcast/Icecast)
+        if self._is_icy_response(response):
+            result['reason'] = 'Valid ICY stream'
+            result['stream_type'] = 'ICY/Shoutcast stream'
+            return True, result
+        
+        # Playlists are validated by content type or extension alone
+        mime = content_type.split(';', 1)[0].strip()
+        playlist_type = PLAYLIST_CONTENT_TYPES.get(mime)
+        if playlist_type is None and url_stream_type in PLAYLIST_STREAM_TYPES:
+            playlist_type = url_stream_type
+        if playlist_type:
+            result['reason'] = 'Valid playlist'
+            result['stream_type'] = playlist_type
+            self._drain(response)
+            return True, result
+        
+        # Check if content type indicates streaming
+        if mime in STREAM_CONTENT_TYPES:
+            result['stream_type'] = self._categorize_stream(content_type)
             
-            # Check for ICY protocol (Shoutcast/Icecast)
-            if 'icy-name' in response.headers or 'icy-metaint' in response.headers:
-                result['reason'] = 'Valid ICY stream'
-                result['stream_type'] = 'ICY/Shoutcast stream'
+            if not has_body:
+                result['reason'] = 'Valid stream (HEAD check)'
                 return True, result
-            
+            if check_playability:
+                # Try to read some data to verify stream is active
+                if self._verify_stream_data(response):
+                    result['reason'] = 'Valid and active stream'
+                    return True, result
+                result['reason'] = 'Stream not providing data'
+                return False, result
+            result['reason'] = 'Valid stream (content type)'
+            return True, result
+        
+        if not has_body:
             result['reason'] = 'Content type not recognized as stream'
             return False, result
-            
-        except Exception as e:
-            result['reason'] = f'HEAD request failed: {str(e)}'
-            return False, result
+        
+        # If no recognized content type, try reading data anyway
+        if check_playability and self._verify_stream_data(response):
+            result['reason'] = 'Active stream (unrecognized type)'
+            result['stream_type'] = 'Unknown stream type'
+            return True, result
+        
+        result['reason'] = 'Not recognized as a valid stream'
+        return False, result
     
-    def _check_with_get(self, url: str, check_playability: bool) -> Tuple[bool, Dict]:
-        """Perform GET request with streaming to verify actual stream data."""
-        result = {
-            'reason': '',
-            'content_type': None,
-            'status_code': None,
-            'stream_type': None
-        }
+    def _is_icy_response(self, response: requests.Response) -> bool:
+        """Detect Shoutcast/Icecast servers from any icy-* header, whatever its case."""
+        return any(name[:4].lower() == 'icy-' for name in response.headers)
+    
+    def _drain(self, response: requests.Response, max_bytes: int = 65536):
+        """
+        Consume a small, finite response body so its connection can be reused.
         
-        try:
-            response = self.session.get(
-                url,
-                timeout=self.timeout,
-                stream=True,
-                allow_redirects=True,
-                headers={'User-Agent': 'Mozilla/5.0 (compatible; StreamChecker/1.0)'}
-            )
-            
-            result['status_code'] = response.status_code
-            
-            if response.status_code != 200:
-                result['reason'] = f'HTTP {response.status_code}'
-                return False, result
-            
-            content_type = response.headers.get('Content-Type', '').lower()
-            result['content_type'] = content_type
-            
-            # Check ICY headers
-            if 'icy-name' in response.headers or 'icy-metaint' in response.headers:
-                result['reason'] = 'Valid ICY stream'
-                result['stream_type'] = 'ICY/Shoutcast stream'
-                return True, result
-            
-            # Check content type
-            for stream_type in self.STREAM_CONTENT_TYPES:
-                if stream_type in content_type:
-                    result['stream_type'] = self._categorize_stream(content_type)
-                    
-                    if check_playability:
-                        # Try to read some data to verify stream is active
-                        if self._verify_stream_data(response):
-                            result['reason'] = 'Valid and active stream'
-                            return True, result
-                        else:
-                            result['reason'] = 'Stream not providing data'
-                            return False, result
-                    else:
-                        result['reason'] = 'Valid stream (content type)'
-                        return True, result
-            
-            # If no recognized content type, try reading data anyway
-            if check_playability and self._verify_stream_data(response):
-                result['reason'] = 'Active stream (unrecognized type)'
-                result['stream_type'] = 'Unknown stream type'
-                return True, result
-            
-            result['reason'] = 'Not recognized as a valid stream'
-            return False, result
-            
-        except Exception as e:
-            result['reason'] = f'GET request failed: {str(e)}'
-            return False, result
+        Live streams never end, so anything without a small Content-Length is
+        left for close() to discard instead.
+        """
+        length = response.headers.get('Content-Length', '')
+        if length.isdigit() and int(length) <= max_bytes:
+            try:
+                response.content
+            except Exception:
+                pass
+    
     def _verify_stream_data(self, response: requests.Response, min_bytes: int = 1024) -> bool:
         """Verify that stream is providing actual binary data (not HTML)."""
         try:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(lambda: b"".join(next(response.iter_content(chunk_size=min_bytes)) for _ in range(1)))
-                try:
-                    chunk = future.result(timeout=5)
-                    if not chunk:
-                        return False
-                    # Reject text-based responses (HTML, JSON, XML)
-                    if chunk.strip().startswith(b"<") or b"<!DOCTYPE html" in chunk[:200].lower():
-                        return False
-                    if b"html" in chunk[:200].lower():
-                        return False
-                    return True
-                except FuturesTimeoutError:
-                    return False
+            # The read timeout set on the GET request bounds how long this can block.
+            # Read straight from the urllib3 response; decoding only kicks in for
+            # compressed bodies (e.g. a gzipped HTML error page)
+            chunk = response.raw.read(min_bytes, decode_content=True)
+            if not chunk:
+                return False
+            # Known audio container, no need to scan for markup
+            if chunk.startswith(AUDIO_MAGIC_PREFIXES):
+                return True
+            # Reject text-based responses (HTML, JSON, XML)
+            head = chunk[:200].lower()
+            if head.lstrip().startswith(b"<") or b"html" in head:
+                return False
+            return True
         except Exception:
+            # Includes ReadTimeout when the server never sends a byte
             return False
         finally:
             response.close()
@@ -288,8 +410,11 @@ class StreamChecker:
             Dictionary mapping URLs to their check results
         """
         results = {}
+        if not urls:
+            return results
         
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # Size the pool to the shared session's connection pool so workers never wait on a socket
+        with ThreadPoolExecutor(max_workers=min(len(urls), _POOL_MAXSIZE)) as executor:
             future_to_url = {
                 executor.submit(self.is_valid_stream, url, check_playability): url 
                 for url in urls
@@ -309,8 +434,4 @@ class StreamChecker:
                     }
         
         return results
-    
-    def __del__(self):
-        """Cleanup session on deletion."""
-        if hasattr(self, 'session'):
-            self.session.close()
+
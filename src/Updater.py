@@ -1,5 +1,6 @@
 import wx
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 import sys
@@ -8,10 +9,47 @@ import tempfile
 import subprocess
 import platform
 import hashlib
+import mmap
+import errno
+import zlib
+import lzma
 from pathlib import Path
-from typing import Optional, Dict, Callable
-from threading import Thread
+from typing import Optional, Dict, Callable, Tuple, TYPE_CHECKING
+from threading import Thread, Lock, Event
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import zip_longest
 import time
+import update_helper
+if TYPE_CHECKING:
+    from packaging.version import Version
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Compressed payload suffixes, unpacked while downloading
+_DECOMPRESSORS = {
+    '.gz': lambda: zlib.decompressobj(16 + zlib.MAX_WBITS),
+    '.xz': lzma.LZMADecompressor,
+}
+if zstandard:
+    _DECOMPRESSORS['.zst'] = lambda: zstandard.ZstdDecompressor().decompressobj()
+
+
+@lru_cache(maxsize=32)
+def _parse_version(v: str) -> Optional["Version"]:
+    """Parse a version string once, or None if it isn't PEP 440 compliant."""
+    # packaging is only needed once an update check runs, not at startup
+    from packaging.version import Version, InvalidVersion
+    try:
+        return Version(v)
+    except InvalidVersion:
+        return None
 
 
 class UpdateInfo:
@@ -112,6 +150,9 @@ class DownloadProgressDialog(wx.Dialog):
                         style=wx.DEFAULT_DIALOG_STYLE)
         
         self.cancelled = False
+        # Latest progress not yet shown; only one CallAfter is queued at a time
+        self._pending_progress = None
+        self._progress_lock = Lock()
         self._create_ui()
         self.Centre()
     
@@ -138,11 +179,19 @@ class DownloadProgressDialog(wx.Dialog):
         
         panel.SetSizer(main_sizer)
     
-    def update_progress(self, percent: float, downloaded: int, total: int, speed: float):
+    def update_progress(self, percent: float, downloaded: int, total: int, speed: int):
         """Update progress information."""
-        wx.CallAfter(self._update_progress_ui, percent, downloaded, total, speed)
+        with self._progress_lock:
+            queued = self._pending_progress is not None
+            self._pending_progress = (percent, downloaded, total, speed)
+        if not queued:
+            wx.CallAfter(self._update_progress_ui)
     
-    def _update_progress_ui(self, percent: float, downloaded: int, total: int, speed: float):
+    def _update_progress_ui(self):
+        with self._progress_lock:
+            percent, downloaded, total, speed = self._pending_progress
+            self._pending_progress = None
+        
         self.progress_bar.SetValue(int(percent))
         
         downloaded_mb = downloaded / (1024 * 1024)
@@ -171,6 +220,24 @@ class AppUpdater:
     Handles checking for updates, downloading, and replacing the application.
     """
     
+    # Attempts made to finish a download after the connection drops
+    DOWNLOAD_RETRIES = 3
+    
+    # Bytes read per network iteration, and the minimum time between progress updates
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+    PROGRESS_INTERVAL_NS = 50_000_000
+    
+    # Ranged connections used for large downloads, and the size that makes it worthwhile
+    DOWNLOAD_CONNECTIONS = 8
+    PARALLEL_MIN_SIZE = 4 * 1024 * 1024
+    
+    # Seconds a fetched manifest is trusted before automatic checks ask the server again
+    MANIFEST_TTL = 6 * 60 * 60
+    
+    # (connect, read) seconds; an unreachable server fails fast, a slow transfer does not
+    MANIFEST_TIMEOUT = (3, 10)
+    DOWNLOAD_TIMEOUT = (5, 30)
+    
     def __init__(self, 
                  current_version: str,
                  update_url: str,
@@ -191,6 +258,21 @@ class AppUpdater:
         self.parent_window = parent_window
         self.temp_dir = tempfile.mkdtemp(prefix="app_update_")
         
+        # Keep-alive connections shared by the update check and every download range
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.DOWNLOAD_CONNECTIONS,
+                              pool_maxsize=self.DOWNLOAD_CONNECTIONS * 2)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': f'{app_name}/{current_version}'})
+        
+        # Validators, fetch time and body of the last update manifest
+        self.cache_file = Path.home() / f".{app_name}_update_cache.json"
+        self._manifest_cache = self._load_manifest_cache()
+        
+        # Remove what earlier runs left behind without delaying startup
+        Thread(target=self._remove_stale_temp_files, daemon=True).start()
+        
     def check_for_updates(self, show_no_update_dialog: bool = False) -> Optional[UpdateInfo]:
         """
         Check if updates are available.
@@ -202,10 +284,8 @@ class AppUpdater:
             UpdateInfo object if update available, None otherwise
         """
         try:
-            response = requests.get(self.update_url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            # Manual checks always ask the server
+            data = self._fetch_manifest(use_fresh_cache=not show_no_update_dialog)
             
             # Expected JSON format:
             # {
@@ -257,6 +337,65 @@ class AppUpdater:
                 )
             return None
     
+    def _fetch_manifest(self, use_fresh_cache: bool = True) -> Dict:
+        """
+        Fetch the update manifest, revalidating the cached copy if there is one.
+        
+        A cached copy younger than MANIFEST_TTL is returned without any request
+        when use_fresh_cache is set. Otherwise a 304 Not Modified reply costs
+        only headers and reuses the cached body.
+        """
+        cache = self._manifest_cache
+        if (use_fresh_cache and 'data' in cache and cache.get('url') == self.update_url
+                and 0 <= time.time() - cache.get('fetched_at', 0) < self.MANIFEST_TTL):
+            return cache['data']
+        
+        headers = {}
+        if self._manifest_cache.get('etag'):
+            headers['If-None-Match'] = self._manifest_cache['etag']
+        if self._manifest_cache.get('last_modified'):
+            headers['If-Modified-Since'] = self._manifest_cache['last_modified']
+        
+        response = self.session.get(self.update_url, timeout=self.MANIFEST_TIMEOUT, headers=headers)
+        if response.status_code == 304 and 'data' in self._manifest_cache:
+            self._manifest_cache['fetched_at'] = time.time()
+            self._save_manifest_cache()
+            return self._manifest_cache['data']
+        response.raise_for_status()
+        
+        # orjson parses the raw bytes directly; it's optional
+        data = orjson.loads(response.content) if orjson else response.json()
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if 'no-store' not in response.headers.get('Cache-Control', ''):
+            self._manifest_cache = {'url': self.update_url, 'etag': etag, 'last_modified': last_modified,
+                                    'fetched_at': time.time(), 'data': data}
+            self._save_manifest_cache()
+        
+        return data
+    
+    def _load_manifest_cache(self) -> Dict:
+        """Load the cached update manifest, if any."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                raw = f.read()
+            cache = orjson.loads(raw) if orjson else json.loads(raw)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_manifest_cache(self):
+        """Persist the cached update manifest."""
+        try:
+            # Serialize first so the file is written in one call
+            raw = (orjson.dumps(self._manifest_cache) if orjson
+                   else json.dumps(self._manifest_cache).encode('utf-8'))
+            with open(self.cache_file, 'wb') as f:
+                f.write(raw)
+        except OSError:
+            pass
+    
     def prompt_update(self, update_info: UpdateInfo) -> int:
         """
         Show update dialog to user.
@@ -291,19 +430,25 @@ class AppUpdater:
         def download_thread():
             try:
                 # Download file
-                local_file = self._download_file(
+                downloaded = self._download_file(
                     update_info.download_url,
                     progress_dlg
                 )
                 
-                if progress_dlg.cancelled or not local_file:
+                if progress_dlg.cancelled or not downloaded:
                     wx.CallAfter(progress_dlg.Close)
                     return
+                local_file, digest = downloaded
                 
                 # Verify checksum if provided
                 if update_info.checksum:
                     progress_dlg.update_status("Verifying download...")
-                    if not self._verify_checksum(local_file, update_info.checksum):
+                    if digest is not None:
+                        # Hashed while downloading, nothing left to read back
+                        verified = digest == update_info.checksum.lower()
+                    else:
+                        verified = self._verify_checksum(local_file, update_info.checksum)
+                    if not verified:
                         wx.CallAfter(self._show_error, "Download verification failed!")
                         wx.CallAfter(progress_dlg.Close)
                         return
@@ -334,56 +479,307 @@ class AppUpdater:
         
         return success[0]
     
-    def _download_file(self, url: str, progress_dlg: DownloadProgressDialog) -> Optional[str]:
-        """Download file with progress tracking."""
+    def _download_file(self, url: str, progress_dlg: DownloadProgressDialog) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Download file with progress tracking.
+        
+        Bytes are written to a partial file named after the URL, so an
+        interrupted or cancelled download resumes with an HTTP Range request
+        instead of starting over.
+        
+        Payloads published compressed (.gz, .xz, .zst) are decompressed as they
+        arrive. Their digest is of the compressed bytes, as published, and they
+        always restart from the beginning since the partial file is decompressed.
+        
+        Returns:
+            Tuple of (local file path, SHA-256 hex digest computed while
+            downloading, or None when the file was fetched out of order),
+            or None on failure/cancellation
+        """
+        partial_file = self._get_partial_path(url)
+        make_decompressor = _DECOMPRESSORS.get(self._get_url_suffix(url))
+        
         try:
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            
-            # Determine file extension
-            ext = self._get_file_extension(url, response)
-            local_file = os.path.join(self.temp_dir, f"update{ext}")
+            # Fresh downloads try several ranged connections first
+            if not os.path.exists(partial_file) and not make_decompressor:
+                local_file = self._download_parallel(url, progress_dlg)
+                if local_file:
+                    return local_file, None
+                if progress_dlg.cancelled:
+                    return None
             
-            downloaded = 0
-            start_time = time.time()
-            
-            with open(local_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if progress_dlg.cancelled:
-                        return None
+            for attempt in range(self.DOWNLOAD_RETRIES):
+                try:
+                    decompressor = None
+                    if make_decompressor:
+                        decompressor = make_decompressor()
+                        self._remove_partial(partial_file)
+                    response, resume_from, total_size = self._open_download(url, partial_file)
                     
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # Calculate progress
-                        if total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            elapsed = time.time() - start_time
-                            speed = downloaded / elapsed if elapsed > 0 else 0
+                    # Determine file extension
+                    ext = self._get_file_extension(url, response)
+                    
+                    # Hash as we go; a resumed download first hashes what is already on disk
+                    sha256_hash = hashlib.sha256()
+                    if resume_from:
+                        with open(partial_file, 'rb') as f:
+                            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                                sha256_hash.update(chunk)
+                    
+                    downloaded = resume_from
+                    start_ns = time.monotonic_ns()
+                    last_ui_ns = 0
+                    
+                    with response, open(partial_file, 'ab' if resume_from else 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                            if progress_dlg.cancelled:
+                                return None
                             
-                            progress_dlg.update_progress(
-                                percent, downloaded, total_size, speed
-                            )
+                            if chunk:
+                                f.write(decompressor.decompress(chunk) if decompressor else chunk)
+                                sha256_hash.update(chunk)
+                                downloaded += len(chunk)
+                                
+                                # Calculate progress, at most every PROGRESS_INTERVAL_NS
+                                now_ns = time.monotonic_ns()
+                                if total_size > 0 and (now_ns - last_ui_ns >= self.PROGRESS_INTERVAL_NS
+                                                       or downloaded >= total_size):
+                                    last_ui_ns = now_ns
+                                    percent = (downloaded / total_size) * 100
+                                    elapsed_ns = now_ns - start_ns
+                                    speed = (downloaded - resume_from) * 1_000_000_000 // elapsed_ns if elapsed_ns else 0
+                                    
+                                    progress_dlg.update_progress(
+                                        percent, downloaded, total_size, speed
+                                    )
+                        
+                        if hasattr(decompressor, 'flush'):
+                            f.write(decompressor.flush())
+                    break
+                except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                    # Connection dropped mid-transfer, resume from what we have
+                    if attempt == self.DOWNLOAD_RETRIES - 1:
+                        raise
             
-            return local_file
+            local_file = os.path.join(self.temp_dir, f"update{ext}")
+            os.replace(partial_file, local_file)
+            self._remove_partial(partial_file)
+            return local_file, sha256_hash.hexdigest()
             
         except Exception as e:
             wx.CallAfter(self._show_error, f"Download failed:\n{str(e)}")
             return None
     
+    def _download_parallel(self, url: str, progress_dlg: DownloadProgressDialog) -> Optional[str]:
+        """
+        Download url over several concurrent Range requests.
+        
+        Returns:
+            Path of the downloaded file, or None if the server doesn't support
+            ranges, the file is too small to benefit, the download failed, or
+            it was cancelled. The caller falls back to a single stream.
+        """
+        try:
+            probe = self.session.head(url, allow_redirects=True, timeout=self.DOWNLOAD_TIMEOUT,
+                                     headers={'Accept-Encoding': 'identity'})
+            probe.raise_for_status()
+        except requests.RequestException:
+            return None
+        
+        total_size = int(probe.headers.get('content-length', 0))
+        if probe.headers.get('Accept-Ranges', '').lower() != 'bytes' or total_size < self.PARALLEL_MIN_SIZE:
+            return None
+        
+        ext = self._get_file_extension(url, probe)
+        local_file = os.path.join(self.temp_dir, f"update{ext}")
+        
+        # Each worker writes its slice at the right offset of a pre-sized file.
+        # Reserving the blocks up front keeps it contiguous and fails now on a full disk
+        with open(local_file, 'wb') as f:
+            try:
+                os.posix_fallocate(f.fileno(), 0, total_size)
+            except (AttributeError, OSError) as e:
+                if getattr(e, 'errno', None) == errno.ENOSPC:
+                    raise
+                f.truncate(total_size)
+        
+        part_size = -(-total_size // self.DOWNLOAD_CONNECTIONS)
+        ranges = [(lo, min(lo + part_size, total_size) - 1) for lo in range(0, total_size, part_size)]
+        
+        lock = Lock()
+        downloaded = [0]
+        start_ns = time.monotonic_ns()
+        last_ui_ns = [0]
+        # Set when one slice fails for good, so the others stop instead of finishing for nothing
+        abort = Event()
+        
+        def fetch(lo: int, hi: int):
+            failures = 0
+            while lo <= hi:
+                headers = {'Accept-Encoding': 'identity', 'Range': f'bytes={lo}-{hi}'}
+                try:
+                    with self.session.get(url, headers=headers, stream=True, timeout=self.DOWNLOAD_TIMEOUT) as response:
+                        if response.status_code != 206:
+                            raise IOError(f"Server ignored range request (HTTP {response.status_code})")
+                        # Separate handle per worker, so seeks don't interfere
+                        with open(local_file, 'r+b') as f:
+                            f.seek(lo)
+                            for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                                if progress_dlg.cancelled or abort.is_set():
+                                    return
+                                if chunk:
+                                    f.write(chunk)
+                                    lo += len(chunk)
+                                    now_ns = time.monotonic_ns()
+                                    with lock:
+                                        downloaded[0] += len(chunk)
+                                        done = downloaded[0]
+                                        report = now_ns - last_ui_ns[0] >= self.PROGRESS_INTERVAL_NS or done >= total_size
+                                        if report:
+                                            last_ui_ns[0] = now_ns
+                                    if report:
+                                        elapsed_ns = now_ns - start_ns
+                                        speed = done * 1_000_000_000 // elapsed_ns if elapsed_ns else 0
+                                        progress_dlg.update_progress(
+                                            (done / total_size) * 100, done, total_size, speed
+                                        )
+                    error = IOError(f"Range ended early at byte {lo}")
+                except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                    error = e
+                # Short of hi: keep what this slice has and ask for the rest
+                if lo <= hi:
+                    failures += 1
+                    if failures == self.DOWNLOAD_RETRIES:
+                        raise error
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch, lo, hi) for lo, hi in ranges]
+                try:
+                    # Failures surface as they happen, not in submission order
+                    for future in as_completed(futures):
+                        future.result()
+                except Exception:
+                    abort.set()
+                    raise
+            if progress_dlg.cancelled or downloaded[0] != total_size:
+                raise IOError("Incomplete download")
+            return local_file
+        except Exception:
+            try:
+                os.remove(local_file)
+            except OSError:
+                pass
+            return None
+    
+    def _get_partial_path(self, url: str) -> str:
+        """Stable location for a partial download of url, shared across runs."""
+        url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return os.path.join(tempfile.gettempdir(), f"app_update_{url_hash}.part")
+    
+    @staticmethod
+    def _response_validator(response: requests.Response) -> Optional[str]:
+        """Strong ETag, or else Last-Modified, identifying the version of a response body."""
+        etag = response.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return response.headers.get('Last-Modified')
+    
+    def _remove_partial(self, partial_file: str):
+        """Delete a partial download and the validator kept beside it."""
+        for path in (partial_file, partial_file + '.validator'):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def _open_download(self, url: str, partial_file: str):
+        """
+        Start the download request, resuming partial_file when possible.
+        
+        A partial file is only resumed with the validator (ETag or
+        Last-Modified) of the response it came from, sent as If-Range: should
+        the URL serve a different file by now, the server answers with the
+        whole new file instead of appending its bytes to the old ones.
+        
+        Returns:
+            Tuple of (streaming response, byte offset the body starts at, total size or 0)
+        """
+        validator_file = partial_file + '.validator'
+        resume_from = os.path.getsize(partial_file) if os.path.exists(partial_file) else 0
+        validator = None
+        if resume_from:
+            try:
+                with open(validator_file, encoding='utf-8') as f:
+                    validator = f.read().strip() or None
+            except OSError:
+                pass
+            if not validator:
+                # Nothing to prove the remote file is unchanged
+                self._remove_partial(partial_file)
+                resume_from = 0
+        # Identity encoding keeps Content-Length and Range offsets in file bytes
+        headers = {'Accept-Encoding': 'identity'}
+        if resume_from:
+            headers['Range'] = f'bytes={resume_from}-'
+            headers['If-Range'] = validator
+        response = self.session.get(url, stream=True, timeout=self.DOWNLOAD_TIMEOUT, headers=headers)
+        
+        if response.status_code == 416:
+            # Partial file is stale or larger than the remote one, start over
+            response.close()
+            self._remove_partial(partial_file)
+            return self._open_download(url, partial_file)
+        
+        response.raise_for_status()
+        content_length = int(response.headers.get('content-length', 0))
+        
+        if resume_from and response.status_code == 206:
+            # Content-Range: bytes <start>-<end>/<total>
+            content_range = response.headers.get('Content-Range', '')
+            try:
+                start = int(content_range.split(' ', 1)[1].split('-', 1)[0])
+            except (IndexError, ValueError):
+                start = -1
+            # Also check the validator, in case the server ignored If-Range
+            if start == resume_from and self._response_validator(response) == validator:
+                return response, resume_from, resume_from + content_length if content_length else 0
+            # Server sent a range we didn't ask for, or of another file
+            response.close()
+            self._remove_partial(partial_file)
+            return self._open_download(url, partial_file)
+        
+        # Full body (server ignored Range, the file changed, or fresh download);
+        # remember what it is, so an interruption can resume it safely
+        new_validator = self._response_validator(response)
+        if new_validator:
+            with open(validator_file, 'w', encoding='utf-8') as f:
+                f.write(new_validator)
+        else:
+            try:
+                os.remove(validator_file)
+            except FileNotFoundError:
+                pass
+        return response, 0, content_length
+    
+    def _get_url_suffix(self, url: str) -> str:
+        """Lower-cased extension of the URL's path, ignoring any query."""
+        return os.path.splitext(url.split('?')[0])[1].lower()
+    
     def _get_file_extension(self, url: str, response: requests.Response) -> str:
         """Determine file extension from URL or headers."""
         # Try from URL
         path = url.split('?')[0]
         ext = os.path.splitext(path)[1]
+        compressed = ext.lower() in _DECOMPRESSORS
+        if compressed:
+            # Decompressed on download, so use the extension underneath
+            ext = os.path.splitext(path[:-len(ext)])[1]
         if ext:
             return ext
         
-        # Try from Content-Type
-        content_type = response.headers.get('Content-Type', '').lower()
+        # Try from Content-Type, unless it only describes the compression
+        content_type = '' if compressed else response.headers.get('Content-Type', '').lower()
         if 'zip' in content_type:
             return '.zip'
         elif 'exe' in content_type:
@@ -407,10 +803,17 @@ class AppUpdater:
     def _verify_checksum(self, file_path: str, expected_checksum: str) -> bool:
         """Verify file checksum."""
         try:
-            sha256_hash = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: read and hash entirely in C
+                    sha256_hash = hashlib.file_digest(f, 'sha256')
+                elif os.fstat(f.fileno()).st_size == 0:
+                    # mmap can't map an empty file
+                    sha256_hash = hashlib.sha256()
+                else:
+                    # Hash straight out of the page cache, no read loop or copies
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        sha256_hash = hashlib.sha256(mm)
             
             return sha256_hash.hexdigest().lower() == expected_checksum.lower()
         except Exception:
@@ -436,22 +839,7 @@ class AppUpdater:
     
     def _install_windows(self, update_file: str, progress_dlg: DownloadProgressDialog) -> bool:
         """Install update on Windows."""
-        current_exe = sys.executable
-        
-        # Create batch script to replace executable
-        batch_script = os.path.join(self.temp_dir, "update.bat")
-        
-        with open(batch_script, 'w') as f:
-            f.write('@echo off\n')
-            f.write('timeout /t 2 /nobreak > nul\n')  # Wait for app to close
-            f.write(f'del /f /q "{current_exe}"\n')
-            f.write(f'move /y "{update_file}" "{current_exe}"\n')
-            f.write(f'start "" "{current_exe}"\n')
-            f.write(f'del "%~f0"\n')  # Delete batch script itself
-        
-        # Launch batch script and exit
-        subprocess.Popen([batch_script], creationflags=subprocess.CREATE_NO_WINDOW,
-                        shell=True)
+        self._launch_helper(update_file, sys.executable)
         return True
     
     def _install_macos(self, update_file: str, progress_dlg: DownloadProgressDialog) -> bool:
@@ -477,13 +865,25 @@ class AppUpdater:
             # Get current app path
             current_app = self._get_macos_app_path()
             
+            # Copy the new bundle next to the current one now, so after exit the
+            # script only has to swap directories (a rename on the same volume)
+            staged_app = f"{current_app}.new"
+            try:
+                shutil.rmtree(staged_app, ignore_errors=True)
+                shutil.copytree(app_bundle, staged_app, symlinks=True)
+            except (OSError, shutil.Error):
+                staged_app = None
+            
             # Create update script
             script_path = os.path.join(self.temp_dir, "update.sh")
             with open(script_path, 'w') as f:
                 f.write('#!/bin/bash\n')
                 f.write('sleep 2\n')
                 f.write(f'rm -rf "{current_app}"\n')
-                f.write(f'cp -R "{app_bundle}" "{os.path.dirname(current_app)}"\n')
+                if staged_app:
+                    f.write(f'mv "{staged_app}" "{current_app}"\n')
+                else:
+                    f.write(f'cp -R "{app_bundle}" "{os.path.dirname(current_app)}"\n')
                 f.write(f'hdiutil detach "{mount_point}"\n')
                 f.write(f'open "{current_app}"\n')
             
@@ -495,22 +895,28 @@ class AppUpdater:
     
     def _install_linux(self, update_file: str, progress_dlg: DownloadProgressDialog) -> bool:
         """Install update on Linux."""
-        current_exe = sys.executable
-        
-        # Create shell script to replace executable
-        script_path = os.path.join(self.temp_dir, "update.sh")
+        self._launch_helper(update_file, sys.executable)
+        return True
+    
+    def _launch_helper(self, update_file: str, current_exe: str):
+        """
+        Start update_helper to swap current_exe for update_file once we exit.
         
-        with open(script_path, 'w') as f:
-            f.write('#!/bin/bash\n')
-            f.write('sleep 2\n')
-            f.write(f'rm -f "{current_exe}"\n')
-            f.write(f'mv "{update_file}" "{current_exe}"\n')
-            f.write(f'chmod +x "{current_exe}"\n')
-            f.write(f'"{current_exe}" &\n')
+        The helper waits on our pid rather than a fixed delay, then renames the
+        file into place. Frozen builds run it through the downloaded executable.
+        """
+        helper_args = [str(os.getpid()), update_file, current_exe]
+        if getattr(sys, 'frozen', False):
+            if os.name != 'nt':
+                os.chmod(update_file, 0o755)
+            command = [update_file, update_helper.HELPER_FLAG] + helper_args
+        else:
+            command = [sys.executable, update_helper.__file__] + helper_args
         
-        os.chmod(script_path, 0o755)
-        subprocess.Popen([script_path])
-        return True
+        if os.name == 'nt':
+            subprocess.Popen(command, creationflags=subprocess.CREATE_NO_WINDOW)
+        else:
+            subprocess.Popen(command, start_new_session=True)
     
     def _get_macos_app_path(self) -> str:
         """Get the path to the .app bundle on macOS."""
@@ -564,23 +970,21 @@ class AppUpdater:
             0 if v1 == v2
             -1 if v1 < v2
         """
+        parsed1 = _parse_version(v1)
+        parsed2 = _parse_version(v2)
+        if parsed1 is not None and parsed2 is not None:
+            # Understands pre-releases such as 1.2.0rc1 < 1.2.0
+            return (parsed1 > parsed2) - (parsed1 < parsed2)
+        
+        # Fall back to comparing the numeric dot-separated parts
         def normalize(v):
             parts = [int(x) for x in v.split('.') if x.isdigit()]
             return parts
         
-        v1_parts = normalize(v1)
-        v2_parts = normalize(v2)
-        
-        # Pad with zeros
-        max_len = max(len(v1_parts), len(v2_parts))
-        v1_parts += [0] * (max_len - len(v1_parts))
-        v2_parts += [0] * (max_len - len(v2_parts))
-        
-        for a, b in zip(v1_parts, v2_parts):
-            if a > b:
-                return 1
-            elif a < b:
-                return -1
+        # Missing trailing parts count as zero
+        for a, b in zip_longest(normalize(v1), normalize(v2), fillvalue=0):
+            if a != b:
+                return (a > b) - (a < b)
         
         return 0
     
@@ -588,19 +992,50 @@ class AppUpdater:
         """Check for updates and perform update if available."""
         update_info = self.check_for_updates(show_no_update_dialog=manual)
         if update_info:
-            user_choice = self.prompt_update(update_info)
-            if user_choice == wx.ID_OK:
-                self.download_and_install(update_info)
-            elif user_choice == wx.ID_NO:
-                # Remind later
-                pass
-            elif user_choice == wx.ID_CANCEL:
-                # Skip this version
-                pass
+            self.offer_update(update_info)
+    
+    def offer_update(self, update_info: UpdateInfo):
+        """Ask the user about an available update and install it if accepted. UI thread only."""
+        user_choice = self.prompt_update(update_info)
+        if user_choice == wx.ID_OK:
+            self.download_and_install(update_info)
+        elif user_choice == wx.ID_NO:
+            # Remind later
+            pass
+        elif user_choice == wx.ID_CANCEL:
+            # Skip this version
+            pass
     def cleanup(self):
-        """Clean up temporary files."""
+        """Clean up temporary files in the background."""
+        self.session.close()
+        if os.path.exists(self.temp_dir):
+            Thread(target=shutil.rmtree, args=(self.temp_dir, True), daemon=True).start()
+    
+    def _remove_stale_temp_files(self, max_age: float = 24 * 60 * 60):
+        """
+        Delete update temp dirs and partial downloads older than max_age seconds.
+        
+        The temp dir can't be removed at exit because the install scripts run
+        from it after the application has closed, so it is swept on a later launch.
+        """
+        temp_root = tempfile.gettempdir()
+        cutoff = time.time() - max_age
         try:
-            if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-        except Exception:
-            pass
+            entries = os.listdir(temp_root)
+        except OSError:
+            return
+        for name in entries:
+            if not name.startswith("app_update_"):
+                continue
+            path = os.path.join(temp_root, name)
+            if path == self.temp_dir:
+                continue
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    os.remove(path)
+            except OSError:
+                continue
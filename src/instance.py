@@ -4,12 +4,53 @@ import platform
 import tempfile
 import fcntl
 import socket
+import errno
 import struct
 import hashlib
+import importlib
+import threading
+import time
 import psutil
+from process import _clear_psutil_cache
 from pathlib import Path
 from typing import Optional, Callable
+from functools import lru_cache
 import atexit
+import weakref
+
+
+@lru_cache(maxsize=32)
+def _unique_id(app_id: str, username: str) -> str:
+    """Hash of app_id + username, used to name the lock file and pick the port."""
+    # Not security sensitive; BLAKE2s is just faster than MD5
+    return hashlib.blake2s(f"{app_id}_{username}".encode(), digest_size=16).hexdigest()
+
+
+# bind() errors meaning the port is already taken (WSAEACCES with SO_EXCLUSIVEADDRUSE)
+_PORT_TAKEN_ERRNOS = {code for code in (errno.EADDRINUSE, errno.EACCES,
+                                        getattr(errno, 'WSAEADDRINUSE', None),
+                                        getattr(errno, 'WSAEACCES', None)) if code}
+
+# Sent by an instance's listener to everyone who connects, followed by its unique id
+_HANDSHAKE_PREFIX = b"single-instance:"
+# Tries, and seconds between them, to get the handshake from the port's owner;
+# it may have bound the port but not be accepting yet
+HANDSHAKE_ATTEMPTS = 3
+HANDSHAKE_RETRY_DELAY = 0.1
+HANDSHAKE_TIMEOUT = 0.5
+
+
+# Instances still holding a lock; the weak references let unused ones be collected
+_INSTANCES = weakref.WeakSet()
+
+
+def _cleanup_all():
+    """Release the locks of all live instances at interpreter exit."""
+    for instance in list(_INSTANCES):
+        instance.cleanup()
+
+
+atexit.register(_cleanup_all)
 
 
 class SingleInstanceException(Exception):
@@ -75,8 +116,8 @@ class SingleInstance:
         if self.method == "auto":
             self.method = self._determine_best_method()
         
-        # Register cleanup
-        atexit.register(self.cleanup)
+        # Released at exit along with every other live instance
+        _INSTANCES.add(self)
         
         # Perform the lock
         self._acquire_lock()
@@ -85,11 +126,7 @@ class SingleInstance:
         """Generate a unique ID based on app_id and user."""
         # Include username to allow different users to run the app
         username = os.getenv('USER') or os.getenv('USERNAME') or 'default'
-        
-        # Create hash of app_id + username
-        unique_string = f"{self.app_id}_{username}"
-        hash_obj = hashlib.md5(unique_string.encode())
-        return hash_obj.hexdigest()
+        return _unique_id(self.app_id, username)
     
     def _determine_best_method(self) -> str:
         """Determine the best locking method for the current platform."""
@@ -152,44 +189,168 @@ class SingleInstance:
     
     def _acquire_socket_lock(self):
         """Acquire lock using socket binding mechanism."""
+        if self.system == "Linux":
+            self._acquire_abstract_socket_lock()
+            return
+        
         # Calculate port from unique_id (range: 49152-65535)
         port_base = 49152
         port_range = 16384
         hash_value = int(self.unique_id[:8], 16)
         port = port_base + (hash_value % port_range)
         
+        token = _HANDSHAKE_PREFIX + self.unique_id.encode()
+        
+        # Binding is the lock: of two instances starting together only one can win
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            # Create socket
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            
-            # Set socket options
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            
-            # Try to bind to localhost
+            # No SO_REUSEADDR: it would let a second instance bind the same port.
+            # On Windows, also stop other programs from binding over ours
+            if hasattr(socket, 'SO_EXCLUSIVEADDRUSE'):
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
             self.socket.bind(('127.0.0.1', port))
+            self.socket.listen(5)
+        except OSError as e:
+            self.socket.close()
+            self.socket = None
+            if e.errno not in _PORT_TAKEN_ERRNOS:
+                raise SingleInstanceException(f"Failed to acquire socket lock: {e}")
+            if self._port_owner_is_instance(port, token):
+                self._handle_already_running("Socket")
+            else:
+                # Some other program has the port; it can't tell us anything
+                self._acquire_file_lock()
+            return
+        
+        self.is_locked = True
+        threading.Thread(target=self._answer_handshakes, args=(self.socket, token),
+                         name="single-instance", daemon=True).start()
+    
+    @staticmethod
+    def _answer_handshakes(listener: socket.socket, token: bytes):
+        """Send token to every connection on listener, until it is closed."""
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            try:
+                conn.sendall(token)
+                # Let the other side close first, so the TIME_WAIT left behind is on
+                # its port and not on ours, which would stop the next instance binding it
+                conn.settimeout(HANDSHAKE_TIMEOUT)
+                conn.recv(1)
+            except OSError:
+                pass
+            finally:
+                conn.close()
+    
+    @staticmethod
+    def _port_owner_is_instance(port: int, token: bytes) -> bool:
+        """Whether the program holding port is another instance, told by its handshake."""
+        for attempt in range(HANDSHAKE_ATTEMPTS):
+            if attempt:
+                time.sleep(HANDSHAKE_RETRY_DELAY)
+            try:
+                with socket.create_connection(('127.0.0.1', port),
+                                              timeout=HANDSHAKE_TIMEOUT) as conn:
+                    received = b""
+                    while len(received) < len(token):
+                        chunk = conn.recv(len(token) - len(received))
+                        if not chunk:
+                            break
+                        received += chunk
+            except OSError:
+                continue
+            # A listener that answers with anything else isn't one of ours
+            return received == token
+        return False
+    
+    def _acquire_abstract_socket_lock(self):
+        """
+        Linux socket lock, binding a name in the abstract Unix socket namespace.
+        
+        The name can't clash with TCP ports and the kernel releases it when
+        the socket closes or the process dies, leaving nothing to clean up.
+        """
+        try:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            # A leading NUL byte puts the address in the abstract namespace
+            self.socket.bind(f"\0{self.unique_id}.lock")
             self.socket.listen(1)
             self.is_locked = True
-            
-        except socket.error:
+        except OSError as e:
+            self.socket.close()
+            self.socket = None
+            if e.errno != errno.EADDRINUSE:
+                raise SingleInstanceException(f"Failed to acquire socket lock: {e}")
             self._handle_already_running("Socket")
-        except Exception as e:
-            raise SingleInstanceException(f"Failed to acquire socket lock: {e}")
     
     def _check_process_lock(self):
-        """Check for running processes with the same executable."""
+        """
+        Check for running processes with the same executable.
+        
+        This has to look at every process, so "auto" never picks it; the file
+        and socket locks answer without a scan.
+        """
         current_pid = os.getpid()
-        current_exe = sys.executable
         current_script = os.path.abspath(sys.argv[0])
         
-        # Get current process command line
+        if os.path.isdir('/proc'):
+            found = self._find_instance_in_proc(current_pid, current_script)
+        else:
+            found = self._find_instance_in_process_list(current_pid, current_script)
+        # The scan is done once, so don't keep its Process objects around
+        _clear_psutil_cache()
+        
+        if found:
+            # Found another instance
+            self._handle_already_running("Process check")
+            return
+        
+        # No other instance found
+        self.is_locked = True
+    
+    def _find_instance_in_proc(self, current_pid: int, current_script: str) -> bool:
+        """
+        Linux version of the process scan, reading /proc directly.
+        
+        A process's comm is compared with our own before anything else is read,
+        so non-matching processes cost one small read instead of resolving
+        their exe link and command line.
+        """
         try:
-            current_proc = psutil.Process(current_pid)
-            current_cmdline = current_proc.cmdline()
-        except:
-            current_cmdline = []
+            with open('/proc/self/comm') as f:
+                own_comm = f.read().strip()
+        except OSError:
+            return self._find_instance_in_process_list(current_pid, current_script)
+        
+        for pid in psutil.pids():
+            # Skip ourselves
+            if pid == current_pid:
+                continue
+            try:
+                with open(f'/proc/{pid}/comm') as f:
+                    if f.read().strip() != own_comm:
+                        continue
+                with open(f'/proc/{pid}/cmdline', errors='replace') as f:
+                    cmdline = f.read().split('\x00')
+            except OSError:
+                # Process exited or isn't ours to read
+                continue
+            
+            # For Python scripts, check if running same script
+            if len(cmdline) > 1 and self._is_same_script(cmdline[1], current_script):
+                return True
+        
+        return False
+    
+    def _find_instance_in_process_list(self, current_pid: int, current_script: str) -> bool:
+        """Portable version of the process scan, through psutil."""
+        current_exe = sys.executable
         
         # Check all running processes
-        for proc in psutil.process_iter(['pid', 'name', 'exe', 'cmdline']):
+        for proc in psutil.process_iter(['pid', 'exe', 'cmdline']):
             try:
                 # Skip ourselves
                 if proc.info['pid'] == current_pid:
@@ -198,21 +359,21 @@ class SingleInstance:
                 # Check if same executable
                 if proc.info['exe'] == current_exe:
                     # Check if same script
-                    cmdline = proc.info.get('cmdline', [])
+                    cmdline = proc.info.get('cmdline') or []
                     
                     # For Python scripts, check if running same script
-                    if cmdline and len(cmdline) > 1:
-                        script_path = os.path.abspath(cmdline[1]) if len(cmdline) > 1 else ""
-                        
-                        if script_path == current_script:
-                            # Found another instance
-                            self._handle_already_running("Process check")
-                            return
+                    if len(cmdline) > 1 and self._is_same_script(cmdline[1], current_script):
+                        return True
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
-        # No other instance found
-        self.is_locked = True
+        return False
+    
+    def _is_same_script(self, script: str, current_script: str) -> bool:
+        """Whether a process's script argument is current_script (an absolute path)."""
+        # Compare file names first, resolving the path only when they agree
+        return (bool(script) and os.path.basename(script) == os.path.basename(current_script)
+                and os.path.abspath(script) == current_script)
     
     def _handle_already_running(self, method: str):
         """Handle the case when application is already running."""
@@ -239,17 +400,20 @@ class SingleInstance:
         """Clean up locks and resources."""
         # Close socket
         if self.socket:
+            # Wakes the handshake thread's accept(); close() alone leaves it listening
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self.socket.close()
             except:
                 pass
             self.socket = None
         
-        # Release file lock
+        # Release file lock (closing the descriptor drops it)
         if self.lock_fd:
             try:
-                if self.system != "Windows":
-                    fcntl.flock(self.lock_fd.fileno(), fcntl.LOCK_UN)
                 self.lock_fd.close()
             except:
                 pass
@@ -295,6 +459,9 @@ class SingleInstanceGuard:
         run_app()
     """
     
+    # GUI modules probed for the duplicate-instance message, by name
+    _toolkits = {}
+    
     def __init__(self, 
                  app_id: str,
                  show_message: bool = True,
@@ -350,10 +517,22 @@ class SingleInstanceGuard:
         # Fallback to console message
         print(self.message)
     
+    @classmethod
+    def _import_toolkit(cls, name: str):
+        """Import a GUI module, or None if it isn't installed. Remembered either way."""
+        if name not in cls._toolkits:
+            try:
+                cls._toolkits[name] = importlib.import_module(name)
+            except ImportError:
+                cls._toolkits[name] = None
+        return cls._toolkits[name]
+    
     def _try_wx_dialog(self) -> bool:
         """Try to show wxPython dialog."""
+        wx = self._import_toolkit('wx')
+        if wx is None:
+            return False
         try:
-            import wx
             app = wx.App()
             wx.MessageBox(
                 self.message,
@@ -361,14 +540,16 @@ class SingleInstanceGuard:
                 wx.OK | wx.ICON_WARNING
             )
             return True
-        except:
+        except Exception:
             return False
     
     def _try_tkinter_dialog(self) -> bool:
         """Try to show Tkinter dialog."""
+        tk = self._import_toolkit('tkinter')
+        messagebox = tk and self._import_toolkit('tkinter.messagebox')
+        if messagebox is None:
+            return False
         try:
-            import tkinter as tk
-            from tkinter import messagebox
             root = tk.Tk()
             root.withdraw()
             messagebox.showwarning(
@@ -377,7 +558,7 @@ class SingleInstanceGuard:
             )
             root.destroy()
             return True
-        except:
+        except Exception:
             return False
     
     def cleanup(self):
@@ -1,27 +1,72 @@
+import os
+import sys
 import psutil
 import platform
+import time
 from typing import List, Dict, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 
 
 class ScreenReader(Enum):
-    """Known screen readers with their process names."""
-    NVDA = ["nvda.exe", "nvda_service.exe", "nvda_slave.exe"]
-    JAWS = ["jfw.exe", "jfwservice.exe"]
-    NARRATOR = ["narrator.exe"]
-    ZDSR = ["zdsr.exe"]
-    SUPERNOVA = ["supernova.exe", "supernovaaccessbridge.exe"]
-    WINDOW_EYES = ["gweyes.exe"]
-    SYSTEMACCESS = ["saapi32.exe", "saapi64.exe"]
-    COBRA = ["cobra.exe"]
-    ORCA = ["orca"]  # Linux
-    VOICEOVER = ["VoiceOver"]  # macOS (part of system)
-    TALKBACK = ["talkback"]  # Android
-    CHROMEVOX = ["chromevox"]  # Chrome OS
+    """Known screen readers with their process names (lower case, matched case-insensitively)."""
+    NVDA = ("nvda.exe", "nvda_service.exe", "nvda_slave.exe")
+    JAWS = ("jfw.exe", "jfwservice.exe")
+    NARRATOR = ("narrator.exe",)
+    ZDSR = ("zdsr.exe",)
+    SUPERNOVA = ("supernova.exe", "supernovaaccessbridge.exe")
+    WINDOW_EYES = ("gweyes.exe",)
+    SYSTEMACCESS = ("saapi32.exe", "saapi64.exe")
+    COBRA = ("cobra.exe",)
+    ORCA = ("orca",)  # Linux
+    VOICEOVER = ("voiceover",)  # macOS (part of system)
+    TALKBACK = ("talkback",)  # Android
+    CHROMEVOX = ("chromevox",)  # Chrome OS
 
 
-@dataclass
+# Process name -> the screen reader it belongs to
+_NAME_TO_READER = {name: reader for reader in ScreenReader for name in reader.value}
+# The same names without extension, which is how process names are matched
+_READER_BASES = frozenset(name.rsplit('.', 1)[0] for name in _NAME_TO_READER)
+
+
+# Process states that count as running
+_RUNNING_STATUSES = frozenset({psutil.STATUS_RUNNING, psutil.STATUS_SLEEPING,
+                               psutil.STATUS_DISK_SLEEP, psutil.STATUS_IDLE})
+
+# Results are created in bulk and never modified; slots=True needs Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# psutil 6+ keeps the Process objects process_iter() hands out; older versions have no cache
+_clear_psutil_cache = getattr(psutil.process_iter, 'cache_clear', lambda: None)
+
+
+def _iter_comm_linux():
+    """
+    Yield (pid, name) of every process by reading /proc/<pid>/comm directly.
+    
+    Much cheaper than psutil.process_iter, which builds a Process object per pid.
+    """
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry.name}/comm', 'rb') as f:
+                name = f.read().rstrip(b'\n').decode('utf-8', 'replace')
+        except OSError:
+            # Process exited
+            continue
+        pid = int(entry.name)
+        if len(name) >= 15:
+            # The kernel cuts comm to 15 characters; psutil recovers the full name
+            try:
+                name = psutil.Process(pid).name()
+            except psutil.Error:
+                continue
+        yield pid, name
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ProcessInfo:
     """Information about a running process."""
     pid: int
@@ -36,7 +81,7 @@ class ProcessInfo:
         return f"ProcessInfo(pid={self.pid}, name='{self.name}', status='{self.status}')"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ProcessCheckResult:
     """Result of a process check."""
     is_running: bool
@@ -53,6 +98,13 @@ class ProcessChecker:
     Handles multiple instances and provides detailed process information.
     """
     
+    # Fields read for each ProcessInfo, and the subset read when usage stats aren't wanted
+    PROCESS_ATTRS = ['pid', 'name', 'exe', 'status', 'cpu_percent', 'memory_info', 'username']
+    BASIC_ATTRS = ['pid', 'name', 'exe', 'status']
+    
+    # Seconds a snapshot of the process table answers further checks
+    SNAPSHOT_TTL = 0.5
+    
     def __init__(self, case_sensitive: bool = False):
         """
         Initialize the process checker.
@@ -62,18 +114,21 @@ class ProcessChecker:
         """
         self.case_sensitive = case_sensitive
         self.system = platform.system()
+        self._snapshot_procs: Optional[Dict[str, list]] = None
+        self._snapshot_time = 0.0
         
-    def is_process_running(self, process_name: str) -> ProcessCheckResult:
+    def is_process_running(self, process_name: str, detailed: bool = False) -> ProcessCheckResult:
         """
         Check if a process with the given name is running.
         
         Args:
             process_name: Name of the process to check (e.g., "nvda.exe", "chrome")
+            detailed: Also read CPU, memory and user of each process
             
         Returns:
             ProcessCheckResult with running status and process details
         """
-        processes = self.find_processes(process_name)
+        processes = self.find_processes(process_name, detailed)
         
         return ProcessCheckResult(
             is_running=len(processes) > 0,
@@ -81,39 +136,125 @@ class ProcessChecker:
             processes=processes
         )
     
-    def find_processes(self, process_name: str) -> List[ProcessInfo]:
+    def find_processes(self, process_name: str, detailed: bool = False) -> List[ProcessInfo]:
         """
         Find all processes matching the given name.
         
         Args:
             process_name: Name of the process to find
+            detailed: Also read CPU, memory and user of each process; otherwise
+                those ProcessInfo fields are 0.0/None
             
         Returns:
             List of ProcessInfo objects for matching processes
         """
-        matching_processes = []
+        return self._scan([process_name], detailed)[process_name]
+    
+    def check_multiple_processes(self, process_names: List[str],
+                                 detailed: bool = False) -> Dict[str, ProcessCheckResult]:
+        """
+        Check multiple processes at once.
         
-        # Normalize process name for comparison
-        search_name = process_name if self.case_sensitive else process_name.lower()
+        Args:
+            process_names: List of process names to check
+            detailed: Also read CPU, memory and user of each process
+            
+        Returns:
+            Dictionary mapping process names to their check results
+        """
+        results = {}
+        
+        for process_name, processes in self._scan(process_names, detailed).items():
+            results[process_name] = ProcessCheckResult(
+                is_running=len(processes) > 0,
+                process_count=len(processes),
+                processes=processes
+            )
+        
+        return results
+    
+    def clear_cache(self):
+        """Forget the process table snapshot, so the next check takes a new one."""
+        self._snapshot_procs = None
+        # Also drop psutil's objects, which may point at pids that have since been reused
+        _clear_psutil_cache()
+    
+    def _scan(self, process_names: List[str], detailed: bool = False) -> Dict[str, List[ProcessInfo]]:
+        """
+        Match all of process_names against one snapshot of the process table.
+        
+        Args:
+            process_names: Names of the processes to find
+            detailed: Also read CPU, memory and user of each process
+            
+        Returns:
+            Dictionary mapping each name to its matching processes
+        """
+        results = {name: [] for name in process_names}
+        snapshot = self._snapshot()
+        prefetch = self.system == 'Windows'
+        # A process matched by several names is only read once
+        read = {}
+        
+        for name in results:
+            search_name = name if self.case_sensitive else name.lower()
+            
+            for entry in snapshot.get(search_name.rsplit('.', 1)[0], ()):
+                pid = entry if isinstance(entry, int) else entry.pid
+                if pid not in read:
+                    try:
+                        # The /proc scan only records pids
+                        proc = psutil.Process(pid) if isinstance(entry, int) else entry
+                        read[pid] = self._read_process(proc, prefetch, detailed)
+                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                        # Process terminated or we don't have permission
+                        read[pid] = None
+                if read[pid]:
+                    results[name].append(read[pid])
+        
+        return results
+    
+    def _snapshot(self) -> Dict[str, list]:
+        """
+        Processes indexed by their normalized name without extension.
+        
+        Names match when they are equal without the extension (e.g. "nvda"
+        matches "nvda.exe"), so each search name is a single lookup. The snapshot is reused for
+        SNAPSHOT_TTL seconds, so back-to-back checks share one pass.
+        
+        Entries are psutil.Process objects, or plain pids on Linux where the
+        names come straight from /proc.
+        """
+        now = time.monotonic()
+        if self._snapshot_procs is not None and now - self._snapshot_time < self.SNAPSHOT_TTL:
+            return self._snapshot_procs
+        
+        procs = {}
+        
+        if self.system == 'Linux':
+            for pid, proc_name in _iter_comm_linux():
+                compare_name = proc_name if self.case_sensitive else proc_name.lower()
+                procs.setdefault(compare_name.rsplit('.', 1)[0], []).append(pid)
+            
+            self._snapshot_procs = procs
+            self._snapshot_time = now
+            return procs
+        
+        # Windows gets every field of a process in one call, so prefetch them there.
+        # Elsewhere they are separate reads, only worth doing for matching processes
+        prefetch = self.system == 'Windows'
         
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe', 'status', 
-                                            'cpu_percent', 'memory_info', 'username']):
+            for proc in psutil.process_iter(self.PROCESS_ATTRS if prefetch else None):
                 try:
-                    proc_name = proc.info['name']
+                    proc_name = proc.info['name'] if prefetch else proc.name()
                     
                     if not proc_name:
                         continue
                     
                     # Normalize for comparison
                     compare_name = proc_name if self.case_sensitive else proc_name.lower()
-                    
-                    # Check if names match
-                    if self._name_matches(compare_name, search_name):
-                        # Verify process is actually running
-                        if self._is_process_actually_running(proc):
-                            process_info = self._create_process_info(proc)
-                            matching_processes.append(process_info)
+                    procs.setdefault(compare_name.rsplit('.', 1)[0], []).append(proc)
                             
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     # Process terminated or we don't have permission
@@ -123,24 +264,9 @@ class ProcessChecker:
             # Handle unexpected errors gracefully
             pass
         
-        return matching_processes
-    
-    def check_multiple_processes(self, process_names: List[str]) -> Dict[str, ProcessCheckResult]:
-        """
-        Check multiple processes at once.
-        
-        Args:
-            process_names: List of process names to check
-            
-        Returns:
-            Dictionary mapping process names to their check results
-        """
-        results = {}
-        
-        for process_name in process_names:
-            results[process_name] = self.is_process_running(process_name)
-        
-        return results
+        self._snapshot_procs = procs
+        self._snapshot_time = now
+        return procs
     
     def get_all_running_processes(self) -> List[ProcessInfo]:
         """
@@ -151,12 +277,13 @@ class ProcessChecker:
         """
         all_processes = []
         
+        prefetch = self.system == 'Windows'
+        
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe', 'status',
-                                            'cpu_percent', 'memory_info', 'username']):
+            for proc in psutil.process_iter(self.PROCESS_ATTRS if prefetch else None):
                 try:
-                    if self._is_process_actually_running(proc):
-                        process_info = self._create_process_info(proc)
+                    process_info = self._read_process(proc, prefetch, detailed=True)
+                    if process_info:
                         all_processes.append(process_info)
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     continue
@@ -165,34 +292,50 @@ class ProcessChecker:
         
         return all_processes
     
-    def _name_matches(self, proc_name: str, search_name: str) -> bool:
-        """Check if process name matches search criteria."""
-        # Exact match
-        if proc_name == search_name:
-            return True
-        
-        # Match without extension (e.g., "nvda" matches "nvda.exe")
-        proc_base = proc_name.rsplit('.', 1)[0]
-        search_base = search_name.rsplit('.', 1)[0]
+    def _read_process(self, proc: psutil.Process, prefetch: bool,
+                      detailed: bool) -> Optional[ProcessInfo]:
+        """
+        Create ProcessInfo for proc if it is actually running.
         
-        return proc_base == search_base
+        Args:
+            proc: psutil.Process object
+            prefetch: Whether proc.info already holds PROCESS_ATTRS
+            detailed: Read PROCESS_ATTRS rather than just BASIC_ATTRS
+            
+        Returns:
+            ProcessInfo, or None if the process isn't running
+        """
+        # The status check and the fields share one read of the process's stat files
+        with proc.oneshot():
+            # Skip Linux kernel threads (kthreadd and its children) before reading
+            # their fields; ppid comes from the same stat read as the status
+            if self.system == 'Linux' and (proc.pid == 2 or proc.ppid() == 2):
+                return None
+            
+            # Verify process is actually running; a prefetched running status settles it
+            status = proc.info.get('status') if prefetch else None
+            if status not in _RUNNING_STATUSES and not self._is_process_actually_running(proc, status):
+                return None
+            info = proc.info if prefetch else proc.as_dict(self.PROCESS_ATTRS if detailed else self.BASIC_ATTRS)
+        return self._create_process_info(proc, info)
     
-    def _is_process_actually_running(self, proc: psutil.Process) -> bool:
+    def _is_process_actually_running(self, proc: psutil.Process, status: Optional[str] = None) -> bool:
         """
         Verify that a process is actually running (not zombie, etc.).
         
         Args:
             proc: psutil.Process object
+            status: proc's status if already known, saving another read
             
         Returns:
             True if process is running, False otherwise
         """
         try:
-            status = proc.status()
+            if status is None:
+                status = proc.status()
             
             # Check if process is in a running state
-            if status in [psutil.STATUS_RUNNING, psutil.STATUS_SLEEPING, 
-                         psutil.STATUS_DISK_SLEEP, psutil.STATUS_IDLE]:
+            if status in _RUNNING_STATUSES:
                 return True
             
             # On Windows, also accept STATUS_STOPPED for services
@@ -209,27 +352,27 @@ class ProcessChecker:
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return False
     
-    def _create_process_info(self, proc: psutil.Process) -> ProcessInfo:
-        """Create ProcessInfo object from psutil.Process."""
+    def _create_process_info(self, proc: psutil.Process, info: Dict) -> ProcessInfo:
+        """Create ProcessInfo object from psutil.Process and its PROCESS_ATTRS values."""
         try:
             # Get memory usage in MB
-            memory_bytes = proc.info.get('memory_info')
+            memory_bytes = info.get('memory_info')
             memory_mb = memory_bytes.rss / (1024 * 1024) if memory_bytes else 0.0
             
             return ProcessInfo(
-                pid=proc.info['pid'],
-                name=proc.info['name'] or 'Unknown',
-                exe_path=proc.info.get('exe'),
-                status=proc.info.get('status', 'unknown'),
-                cpu_percent=proc.info.get('cpu_percent', 0.0) or 0.0,
+                pid=info['pid'],
+                name=info['name'] or 'Unknown',
+                exe_path=info.get('exe'),
+                status=info.get('status', 'unknown'),
+                cpu_percent=info.get('cpu_percent', 0.0) or 0.0,
                 memory_mb=memory_mb,
-                username=proc.info.get('username')
+                username=info.get('username')
             )
         except Exception:
             # Fallback with minimal info
             return ProcessInfo(
-                pid=proc.info['pid'],
-                name=proc.info['name'] or 'Unknown',
+                pid=proc.pid,
+                name=info.get('name') or 'Unknown',
                 exe_path=None,
                 status='unknown',
                 cpu_percent=0.0,
@@ -248,6 +391,14 @@ class ScreenReaderChecker(ProcessChecker):
         """Initialize screen reader checker."""
         super().__init__(case_sensitive=False)
         self.detected_readers: Set[str] = set()
+        # Result of the last process table scan and when it was taken; kept for SNAPSHOT_TTL
+        self._reader_processes: Optional[Dict[str, List[ProcessInfo]]] = None
+        self._reader_time = 0.0
+    
+    def clear_cache(self):
+        """Forget the last scan, so the next check looks at the process table again."""
+        super().clear_cache()
+        self._reader_processes = None
     
     def is_screen_reader_running(self) -> bool:
         """
@@ -257,13 +408,47 @@ class ScreenReaderChecker(ProcessChecker):
             True if at least one screen reader is detected
         """
         self.detected_readers.clear()
-        
-        for reader in ScreenReader:
-            if self._check_screen_reader(reader):
-                self.detected_readers.add(reader.name)
+        self.detected_readers.update(self.get_detailed_screen_reader_info())
         
         return len(self.detected_readers) > 0
     
+    def any_screen_reader_running(self) -> bool:
+        """
+        Check if any known screen reader is running, stopping at the first one found.
+        
+        Cheaper than is_screen_reader_running when it doesn't matter which
+        readers are running.
+        
+        Returns:
+            True if at least one screen reader is detected
+        """
+        if self._readers_fresh():
+            return bool(self._reader_processes)
+        
+        if self.system == 'Linux':
+            for pid, proc_name in _iter_comm_linux():
+                if proc_name.lower().rsplit('.', 1)[0] in _READER_BASES:
+                    try:
+                        if self._is_process_actually_running(psutil.Process(pid)):
+                            return True
+                    except psutil.Error:
+                        continue
+            return False
+        
+        try:
+            for proc in psutil.process_iter(['name']):
+                try:
+                    proc_name = proc.info['name']
+                    if (proc_name and proc_name.lower().rsplit('.', 1)[0] in _READER_BASES
+                            and self._is_process_actually_running(proc)):
+                        return True
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+        except Exception:
+            pass
+        
+        return False
+    
     def get_running_screen_readers(self) -> List[str]:
         """
         Get list of all running screen readers.
@@ -278,23 +463,32 @@ class ScreenReaderChecker(ProcessChecker):
         """
         Get detailed information about running screen readers.
         
+        The process table is scanned once for every known screen reader and the
+        result reused by all checks for SNAPSHOT_TTL seconds, or until
+        clear_cache() is called. Only pid, name, exe and status are read;
+        detection never needs the usage stats.
+        
         Returns:
             Dictionary mapping screen reader names to their process information
         """
-        detailed_info = {}
-        
-        for reader in ScreenReader:
-            processes = []
+        if not self._readers_fresh():
+            now = time.monotonic()
+            detailed_info = {}
             
-            for process_name in reader.value:
-                result = self.is_process_running(process_name)
-                if result.is_running:
-                    processes.extend(result.processes)
+            for process_name, processes in self._scan(list(_NAME_TO_READER)).items():
+                if processes:
+                    reader = _NAME_TO_READER[process_name]
+                    detailed_info.setdefault(reader.name, []).extend(processes)
             
-            if processes:
-                detailed_info[reader.name] = processes
+            self._reader_processes = detailed_info
+            self._reader_time = now
         
-        return detailed_info
+        return dict(self._reader_processes)
+    
+    def _readers_fresh(self) -> bool:
+        """Whether the last screen reader scan is recent enough to answer from."""
+        return (self._reader_processes is not None
+                and time.monotonic() - self._reader_time < self.SNAPSHOT_TTL)
     
     def check_specific_screen_reader(self, reader_name: str) -> ProcessCheckResult:
         """
@@ -308,9 +502,7 @@ class ScreenReaderChecker(ProcessChecker):
         """
         reader_name_upper = reader_name.upper()
         
-        try:
-            reader = ScreenReader[reader_name_upper]
-        except KeyError:
+        if reader_name_upper not in ScreenReader.__members__:
             # Unknown screen reader
             return ProcessCheckResult(
                 is_running=False,
@@ -318,12 +510,7 @@ class ScreenReaderChecker(ProcessChecker):
                 processes=[]
             )
         
-        all_processes = []
-        
-        for process_name in reader.value:
-            result = self.is_process_running(process_name)
-            if result.is_running:
-                all_processes.extend(result.processes)
+        all_processes = self.get_detailed_screen_reader_info().get(reader_name_upper, [])
         
         return ProcessCheckResult(
             is_running=len(all_processes) > 0,
@@ -333,11 +520,7 @@ class ScreenReaderChecker(ProcessChecker):
     
     def _check_screen_reader(self, reader: ScreenReader) -> bool:
         """Check if a specific screen reader enum is running."""
-        for process_name in reader.value:
-            result = self.is_process_running(process_name)
-            if result.is_running:
-                return True
-        return False
+        return reader.name in self.get_detailed_screen_reader_info()
     
     def is_nvda_running(self) -> bool:
         """Quick check for NVDA."""
@@ -1,31 +1,117 @@
+import sys
+import update_helper
+# Started by the updater to put a new executable in place, not as the player
+if len(sys.argv) > 1 and sys.argv[1] == update_helper.HELPER_FLAG:
+    sys.exit(update_helper.main(sys.argv[2:]))
+
 import wx
 import wx.adv
-import requests
 from datetime import datetime
 import threading
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import zipfile
-import tempfile
-from packaging import version
-import io
 import time
-import platform
-import sys
 import json
 import os
+import re
+import hashlib
+from functools import lru_cache, cached_property
+import logging
+from operator import attrgetter
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from stream_recorder import StreamRecorder
-from radio_api import RadioStation, RadioBrowserAPI
+from radio_api import RadioStation, RadioBrowserAPI, LazyStationList
 from settingsDialog import SettingsDialog
 from addStationDialog import AddStationDialog
 import updater
 import process
-sr_checker = process.ScreenReaderChecker()
-if sr_checker.is_screen_reader_running():
-    import accessible_output2 as auto
-    o = auto.Auto()
-else:
-    o = None
+
+# Errors are logged rather than printed; silent unless the app configures logging
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Parsed settings file and the st_mtime_ns it was read at
+_settings_cache = {'mtime': None, 'data': None}
+
+def read_json(path):
+    """Parse a JSON file, with orjson when it is available"""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def json_line(data):
+    """Encode data as one line of a JSON Lines file"""
+    if orjson:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data).encode('utf-8') + b"\n"
+
+def write_atomic(path, payload):
+    """Replace the file at path with payload, never leaving it half written"""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+        # On disk before the rename, or a crash could leave an empty file in its place
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def write_json(path, data):
+    """Write data to a JSON file, indented so it stays hand-editable"""
+    if orjson:
+        write_atomic(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        write_atomic(path, json.dumps(data, indent=2).encode('utf-8'))
+
+# One station per line, so adding a favorite appends instead of rewriting
+FAVORITES_FILE = Path.home() / ".radio_favorites.jsonl"
+# Single JSON array used by earlier versions, converted on first load
+LEGACY_FAVORITES_FILE = Path.home() / ".radio_favorites.json"
+
+# Anything but letters, digits, space, '-' and '_'
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]')
+
+@lru_cache(maxsize=512)
+def safe_filename(name):
+    """Strip a station name down to characters safe in a file name"""
+    return _UNSAFE_FILENAME_CHARS.sub('', name).strip()
+
+def index_stations(stations):
+    """Search rows (station, lowercase name, country, lowercase language) for stations,
+    all of them and grouped by country and by continent"""
+    rows = [(s, s.name.lower(), s.country, s.language.lower()) for s in stations]
+    by_country, by_continent = {}, {}
+    for row in rows:
+        by_country.setdefault(row[2], []).append(row)
+        by_continent.setdefault(row[0].continent, []).append(row)
+    return rows, by_country, by_continent
+
+def favorite_record(fav):
+    """Fields of a favorite station that are written to the favorites file"""
+    return {
+        'name': fav.name,
+        'url': fav.url,
+        'country': fav.country,
+        'countrycode': fav.countrycode,
+        'state': fav.state,
+        'language': fav.language,
+        'bitrate': fav.bitrate,
+        'codec': fav.codec,
+        'tags': fav.tags,
+        'favicon': fav.favicon,
+        'geo_lat': fav.geo_lat,
+        'geo_long': fav.geo_long
+    }
+
+# Country and language lists from the API, reused for a day across starts
+META_CACHE_FILE = Path.home() / ".radio_meta_cache.json"
+META_CACHE_TTL = 24 * 60 * 60
+# Top voted stations, one record per line, reused for an hour across starts
+STATIONS_CACHE_FILE = Path.home() / ".radio_stations_cache.jsonl"
+STATIONS_CACHE_TTL = 60 * 60
+
 APP_VERSION = "1.0.0"
 UPDATE_URL = "https://gruiachiscop.dev/radio-browser-accessible/update"
 #We trick the app to believe that vlc is installed in the app's director
@@ -34,8 +120,7 @@ if getattr(sys, 'frozen', False):
     os.environ['PATH'] = base_path + os.pathsep + os.environ.get('PATH', '')
     os.environ['VLC_PLUGIN_PATH'] = os.path.join(base_path, 'plugins')
 #os.environ['PYTHON_VLC_LIB_PATH'] = os.path.join(base_path, 'libvlc.dll')
-
-import vlc
+# vlc itself is imported on first playback, see RadioPlayerFrame._ensure_vlc
 
 class LiveRegion(wx.Accessible):
     def __init__(self, win):
@@ -49,35 +134,160 @@ class LiveRegion(wx.Accessible):
         wx.Accessible.NotifyEvent(wx.ACC_EVENT_OBJECT_NAMECHANGE, self.GetWindow(), wx.OBJID_CLIENT, 0)
 
 
+class StationListCtrl(wx.ListCtrl):
+    """Virtual report list of stations; wx only asks for the rows it shows."""
+    # (label, width, RadioStation attribute shown)
+    COLUMNS = (("Station Name", 250, 'name'), ("Location", 150, 'location'),
+               ("Country", 100, 'country'), ("Language", 100, 'language'),
+               ("Bitrate", 80, 'bitrate_label'))
+    
+    def __init__(self, parent, get_stations, columnar=False):
+        """With columnar, cell texts are copied into one list per column on refresh,
+        so repaints index plain lists; leave it off for lists built lazily."""
+        super().__init__(parent, style=wx.LC_REPORT|wx.LC_VIRTUAL|wx.LC_SINGLE_SEL)
+        self.get_stations = get_stations
+        self._column_attrs = tuple(attr for _, _, attr in self.COLUMNS)
+        self._row_texts = attrgetter(*self._column_attrs)
+        self._columns = [[] for _ in self.COLUMNS] if columnar else None
+        # Stream URL of each row at the last refresh
+        self._shown_urls = []
+        for label, width, _ in self.COLUMNS:
+            self.AppendColumn(label, width=width)
+    
+    def OnGetItemText(self, item, column):
+        if self._columns is not None:
+            texts = self._columns[column]
+            return texts[item] if item < len(texts) else ""
+        stations = self.get_stations()
+        if item >= len(stations):
+            return ""
+        return getattr(stations[item], self._column_attrs[column])
+    
+    def _fill_columns(self, stations, start):
+        """Copy cell texts of stations[start:] into the column lists"""
+        if start == 0:
+            self._columns = [[] for _ in self.COLUMNS]
+        for texts, new in zip(self._columns, zip(*map(self._row_texts, stations[start:]))):
+            texts.extend(new)
+    
+    def refresh(self, appended=False):
+        """
+        Show the current stations, keeping the selected station selected if it is still listed.
+        
+        appended means stations were only added at the end since the last refresh:
+        earlier rows are left as they are, selection included, and only the new
+        rows are filled in. Pass False after any other change.
+        """
+        stations = self.get_stations()
+        count = len(stations)
+        if self._columns is not None:
+            self._fill_columns(stations, len(self._columns[0]) if appended else 0)
+        selected_url = None if appended else self._selected_url()
+        # Snapshot, as the list may be changed in place before the next refresh
+        urls = stations.urls() if isinstance(stations, LazyStationList) else [s.url for s in stations]
+        # One repaint for the clear and the new count together
+        self.Freeze()
+        try:
+            if appended:
+                self.SetItemCount(count)
+                if count:
+                    self.RefreshItems(0, count - 1)
+            else:
+                self.DeleteAllItems()
+                self.SetItemCount(count)
+                if selected_url in urls:
+                    index = urls.index(selected_url)
+                    self.Select(index)
+                    self.Focus(index)
+        finally:
+            self.Thaw()
+        self._shown_urls = urls
+    
+    def _selected_url(self):
+        """Stream URL of the selected row as last shown, or None"""
+        index = self.GetFirstSelected()
+        if 0 <= index < len(self._shown_urls):
+            return self._shown_urls[index]
+        return None
+
+
 class RadioPlayerFrame(wx.Frame):
+    # Milliseconds a status message waits before it is announced
+    STATUS_DELAY = 150
+    # Loaded stations matching a filter that make a server search unnecessary
+    LOCAL_FILTER_MIN = 50
+    # Milliseconds after the last removal before favorites are rewritten
+    FAVORITES_SAVE_DELAY = 500
+    # Seconds the hidden window waits for playback to stop before it is destroyed
+    TEARDOWN_TIMEOUT = 2
+    # Context menu entries of the two lists
+    STATION_MENU = ("Play", "Add to Favorites", "Copy Stream URL")
+    FAVORITE_MENU = ("Play", "Remove from Favorites", "Copy Stream URL")
+    
     def __init__(self):
         super().__init__(parent=None, title='Radio Browser Player', size=(1000, 700))
         
         self.api = RadioBrowserAPI()
         self.stations = []
         self.filtered_stations = []
-        self.favorites = []
+        # Filter values the station list currently reflects
+        self._last_filters = None
+        # index_stations() rows for the loaded stations, all and by country and continent
+        self._station_index = ([], {}, {})
+        self.favorites = LazyStationList()
+        # blake2b of the favorites file as last written by save_favorites
+        self._favorites_digest = None
+        # Stream URLs of self.favorites, for constant-time duplicate checks
+        self._favorite_urls = set()
         self.current_station = None
+        # Counts playbacks started, so a late error from an earlier one is ignored
+        self._play_id = 0
         self.current_favorite_index = -1
         self.recorder = None
         self.recording = False
+        # (recording_dir setting, Path) of the directory already created
+        self._recordings_dir = None
         self.current_offset = 0
         self.stations_per_page = 1000
         self.has_more_stations = False
-        #continents
-        self.continent_map = self.api.get_continents()
+        # Continent name -> country codes, filled in by populate_filters
+        self.continent_map = {}
         # Settings
         self.settings = self.load_settings()
         
         self.is_playing = False
         self.is_muted = False
         self.volume = 70
-        self.vlc_instance = vlc.Instance('--no-xlib')
-        self.player = self.vlc_instance.media_player_new()
+        # Created on first play, so VLC's plugin scan doesn't delay the window
+        self.vlc_instance = None
+        self.player = None
 
         self.stream_thread = None
         self.stop_stream = False
         
+        # Background API calls; only results of the latest station request are shown
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="rb-io")
+        self._req_epoch = 0
+        # ((query, offset), Future) of the next Load More page, fetched ahead
+        self._prefetch = None
+        # Future of the latest filter search
+        self._search_future = None
+        
+        # Searches start once typing pauses rather than on every keystroke
+        self._search_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_filter_change, self._search_timer)
+        
+        # Latest status message and the wx.CallLater that will announce it
+        self._pending_status = None
+        self._status_call = None
+        
+        # Pending wx.CallLater of a favorites rewrite, so removals in a row write once
+        self._save_call = None
+        # {labels: (wx.Menu, item ids)}, built on first use and reused after
+        self._context_menus = {}
+        self._closing = False
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        
         # Load favorites
         self.load_favorites()
         
@@ -87,10 +297,10 @@ class RadioPlayerFrame(wx.Frame):
         self.api._get_base_url()
         #initialise the updater
         self.updater = Updater.AppUpdater(APP_VERSION, "https://gruiachiscop.dev/radio-browser-accessible/update", "radio-browser-accessible", self)
+        # Set while a background update check is running
+        self._update_check_running = threading.Event()
         if self.settings.get('check_updates', True):
-            t = threading.Thread(target=self.updater.update)
-            t.daemon = True
-            t.start()
+            self.start_update_check()
         # Load initial data
         self.load_countries_and_languages()
         
@@ -129,8 +339,10 @@ class RadioPlayerFrame(wx.Frame):
         
         # Search
         filter_sizer.Add(wx.StaticText(panel, label="Search:"), 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-        self.search_ctrl = wx.TextCtrl(panel, size=(200, -1))
-        self.search_ctrl.Bind(wx.EVT_TEXT, self.on_filter_change)
+        self.search_ctrl = wx.TextCtrl(panel, size=(200, -1), style=wx.TE_PROCESS_ENTER)
+        self.search_ctrl.Bind(wx.EVT_TEXT, self.on_search_text)
+        # Enter searches right away instead of waiting out the typing delay
+        self.search_ctrl.Bind(wx.EVT_TEXT_ENTER, self.on_filter_change)
         filter_sizer.Add(self.search_ctrl, 0, wx.ALL, 5)
         
         # Country filter
@@ -172,12 +384,8 @@ class RadioPlayerFrame(wx.Frame):
         self.stations_panel = wx.Panel(self.notebook)
         stations_sizer = wx.BoxSizer(wx.VERTICAL)
         stations_sizer.Add(wx.StaticText(self.stations_panel, label="Stations"), 0, wx.ALL, 5)
-        self.stations_list = wx.ListCtrl(self.stations_panel, style=wx.LC_REPORT|wx.LC_SINGLE_SEL)
-        self.stations_list.AppendColumn("Station Name", width=250)
-        self.stations_list.AppendColumn("Location", width=150)
-        self.stations_list.AppendColumn("Country", width=100)
-        self.stations_list.AppendColumn("Language", width=100)
-        self.stations_list.AppendColumn("Bitrate", width=80)
+        self.stations_list = StationListCtrl(self.stations_panel, lambda: self.filtered_stations,
+                                             columnar=True)
         self.stations_list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_station_play)
         self.stations_list.Bind(wx.EVT_CONTEXT_MENU, self.on_station_context_menu)
         
@@ -188,12 +396,7 @@ class RadioPlayerFrame(wx.Frame):
         self.favorites_panel = wx.Panel(self.notebook)
         favorites_sizer = wx.BoxSizer(wx.VERTICAL)
         favorites_sizer.Add(wx.StaticText(self.favorites_panel, label="Favourite Stations"), 0, wx.ALL, 5)
-        self.favorites_list = wx.ListCtrl(self.favorites_panel, style=wx.LC_REPORT|wx.LC_SINGLE_SEL)
-        self.favorites_list.AppendColumn("Station Name", width=250)
-        self.favorites_list.AppendColumn("Location", width=150)
-        self.favorites_list.AppendColumn("Country", width=100)
-        self.favorites_list.AppendColumn("Language", width=100)
-        self.favorites_list.AppendColumn("Bitrate", width=80)
+        self.favorites_list = StationListCtrl(self.favorites_panel, lambda: self.favorites)
         self.favorites_list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_favorite_play)
         self.favorites_list.Bind(wx.EVT_CONTEXT_MENU, self.on_favorite_context_menu)
         
@@ -279,31 +482,60 @@ class RadioPlayerFrame(wx.Frame):
         #if hasattr(self.status_text, 'SetName'):
             #self.status_text.SetName("status")
         main_sizer.Add(self.live_region, 0, wx.ALL, 0)
-        if o:
-            self.Bind(wx.EVT_CHAR_HOOK, self.on_handle_key_press)
+        self.Bind(wx.EVT_CHAR_HOOK, self.on_handle_key_press)
         panel.SetSizer(main_sizer)
     
     def set_status(self, message):
         """Set status bar text and announce to screen readers via live region"""
+        if not wx.IsMainThread():
+            wx.CallAfter(self.set_status, message)
+            return
         self.status_bar.SetStatusText(message)
+        # Only the last of several quick messages is announced
+        self._pending_status = message
+        if self._status_call is None:
+            self._status_call = wx.CallLater(self.STATUS_DELAY, self._flush_status)
+        else:
+            self._status_call.Restart(self.STATUS_DELAY)
+    
+    def _flush_status(self):
+        """Announce the latest status message"""
+        message = self._pending_status
         # Update live region for screen readers
         self.status_text.SetLabel(message)
         self.accessibleLiveRegion.SetText(message)
         #since the accessible live regions doesn't seem to work, we'll use the accessible-output2 module for speech, if available
+        self.speak(message)
+    
+    @cached_property
+    def tts(self):
+        """Speech output of the running screen reader, or None; probed on first use, after the window is up"""
+        # A failure is returned as None too, so it is cached instead of retried on every key
         try:
-            o.output(message)
+            if not process.ScreenReaderChecker().any_screen_reader_running():
+                return None
+            import accessible_output2 as auto
+            return auto.Auto()
+        except Exception as e:
+            log.warning("Error starting screen reader speech: %s", e)
+            return None
+    
+    def speak(self, message):
+        """Speak message through the screen reader, if one is running"""
+        try:
+            if self.tts:
+                self.tts.output(message)
         except:
             pass
     
     def on_settings(self, event):
         """Open settings dialog"""
-        dlg = SettingsDialog(self, self.settings)
+        dlg = SettingsDialog.open(self, self.settings)
         if dlg.ShowModal() == wx.ID_OK:
             self.settings = dlg.settings
             self.save_settings()
             # Apply buffer size
             self.set_status("Settings saved")
-        dlg.Destroy()
     
     def on_about(self, event):
         """Show about dialog"""
@@ -314,14 +546,60 @@ class RadioPlayerFrame(wx.Frame):
         info.SetWebSite("https://gruiachiscop.dev")
         wx.adv.AboutBox(info)
     
+    def start_update_check(self):
+        """Check for updates in the background, unless a check is already running"""
+        if self._update_check_running.is_set():
+            return
+        self._update_check_running.set()
+        self._pool.submit(self._update_check)
+    
+    def _update_check(self):
+        try:
+            update_info = self.updater.check_for_updates()
+        finally:
+            self._update_check_running.clear()
+        # The prompt and any download dialog belong on the UI thread
+        if update_info:
+            wx.CallAfter(self.updater.offer_update, update_info)
+    
     def on_exit(self, event):
         """Exit application"""
-        if self.is_playing:
-            self.player.stop()
-        if self.recording:
-            self.stop_recording()
         self.Close()
     
+    def on_close(self, event):
+        """Hide at once and finish shutting down once playback has stopped"""
+        if self._closing:
+            return
+        self._closing = True
+        self.Hide()
+        
+        self._search_timer.Stop()
+        if self._status_call:
+            self._status_call.Stop()
+        self.flush_favorites()
+        if self.recorder:
+            self.recorder.stop()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        # The context menus have no parent window to destroy them
+        for menu, ids in self._context_menus.values():
+            menu.Destroy()
+        
+        # VLC can take a while to stop a stream; keep that off the UI thread
+        player = self.player if self.is_playing else None
+        def teardown():
+            if player:
+                player.stop()
+            self.api.close()
+        
+        thread = threading.Thread(target=teardown, daemon=True)
+        thread.start()
+        wx.CallAfter(self._finish_close, thread)
+    
+    def _finish_close(self, teardown_thread):
+        """Destroy the hidden frame once teardown is done or has had long enough"""
+        teardown_thread.join(self.TEARDOWN_TIMEOUT)
+        self.Destroy()
+    
     def load_settings(self):
         """Load settings from file"""
         settings_file = Path.home() / ".radio_settings.json"
@@ -334,64 +612,113 @@ class RadioPlayerFrame(wx.Frame):
             'volume': 0.7
         }
         
-        if settings_file.exists():
+        try:
+            mtime = settings_file.stat().st_mtime_ns
+        except OSError:
+            return default_settings
+        
+        # Re-parse only when the file changed since it was last read
+        if _settings_cache['mtime'] != mtime:
             try:
-                with open(settings_file, 'r') as f:
-                    loaded = json.load(f)
-                    default_settings.update(loaded)
+                _settings_cache['data'] = read_json(settings_file)
+                _settings_cache['mtime'] = mtime
             except Exception as e:
-                print(f"Error loading settings: {e}")
+                log.warning("Error loading settings: %s", e)
+                return default_settings
         
+        default_settings.update(_settings_cache['data'])
         return default_settings
     
     def save_settings(self):
         """Save settings to file"""
         settings_file = Path.home() / ".radio_settings.json"
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            write_json(settings_file, self.settings)
+            # What was just written is what the next load would parse
+            _settings_cache['data'] = dict(self.settings)
+            _settings_cache['mtime'] = settings_file.stat().st_mtime_ns
         except Exception as e:
-            print(f"Error saving settings: {e}")
+            log.warning("Error saving settings: %s", e)
     
     def load_countries_and_languages(self):
         """Load countries and languages into dropdowns"""
         self.set_status("Loading countries and languages...")
         
         def load_data():
-            countries = self.api.get_countries()
-            languages = self.api.get_languages()
+            meta = self.read_meta_cache()
+            if meta:
+                countries, languages = meta['countries'], meta['languages']
+            else:
+                # Fetch languages on the other worker while this one gets countries
+                languages = self._pool.submit(self.api.get_languages)
+                countries = self.api.get_countries()
+                languages = languages.result()
+                # Empty lists mean a request failed; try again next start
+                if countries and languages:
+                    self.write_meta_cache(countries, languages)
             continents = self.api.get_continents()
             wx.CallAfter(self.populate_filters, countries, languages, continents)
             #self.populate_filters(countries, languages, continents)
         
-        thread = threading.Thread(target=load_data)
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(load_data)
+    
+    def read_meta_cache(self):
+        """Cached country and language lists, or None if missing or older than META_CACHE_TTL"""
+        try:
+            if time.time() - META_CACHE_FILE.stat().st_mtime > META_CACHE_TTL:
+                return None
+            meta = read_json(META_CACHE_FILE)
+            if isinstance(meta.get('countries'), list) and isinstance(meta.get('languages'), list):
+                return meta
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Error reading country/language cache: %s", e)
+        return None
+    
+    def write_meta_cache(self, countries, languages):
+        """Keep country and language lists for the next starts"""
+        try:
+            write_json(META_CACHE_FILE, {'countries': countries, 'languages': languages})
+        except Exception as e:
+            log.warning("Error writing country/language cache: %s", e)
+    
+    def read_stations_cache(self):
+        """Cached top voted stations, or None if missing or older than STATIONS_CACHE_TTL"""
+        try:
+            if time.time() - STATIONS_CACHE_FILE.stat().st_mtime > STATIONS_CACHE_TTL:
+                return None
+            loads = orjson.loads if orjson else json.loads
+            with open(STATIONS_CACHE_FILE, 'rb') as f:
+                stations = [RadioStation.from_record(loads(line)) for line in f if line.strip()]
+            return stations or None
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Error reading station cache: %s", e)
+        return None
+    
+    def write_stations_cache(self, stations):
+        """Keep the top voted stations for the next starts"""
+        try:
+            write_atomic(STATIONS_CACHE_FILE, b"".join(json_line(favorite_record(s)) for s in stations))
+        except Exception as e:
+            log.warning("Error writing station cache: %s", e)
     
     def populate_filters(self, countries, languages, continents):
         """Populate filter dropdowns"""
-        def populate():
-            self.country_choice.Clear()
-            self.country_choice.Append("All")
-            for country in countries:
-                self.country_choice.Append(country)
-                self.country_choice.SetSelection(0)
-        
-            self.language_choice.Clear()
-            self.language_choice.Append("All")
-            for language in languages:
-                self.language_choice.Append(language)
-            self.language_choice.SetSelection(0)
-        
-            self.continent_choice.Clear()
-            self.continent_choice.Append("All")
-            for continent in self.api.get_continents_list():
-                self.continent_choice.Append(continent)
-            self.continent_choice.SetSelection(0)
-        # make it async
-        t = threading.Thread(target=populate)
-        t.daemon = True
-        t.start()
+        self.continent_map = continents
+        # Called through wx.CallAfter, so the controls can be filled directly
+        for choice, items in ((self.country_choice, countries),
+                              (self.language_choice, languages),
+                              (self.continent_choice, continents)):
+            # Fill and select with a single repaint
+            choice.Freeze()
+            try:
+                choice.Set(["All", *items])
+                choice.SetSelection(0)
+            finally:
+                choice.Thaw()
         self.set_status("Ready - Click 'Load Stations' to start")
     
     def on_load_stations(self, event):
@@ -401,12 +728,17 @@ class RadioPlayerFrame(wx.Frame):
         self.current_offset = 0
         
         def load():
-            self.stations = self.api.get_stations()
-            wx.CallAfter(self.on_stations_loaded)
-        
-        thread = threading.Thread(target=load)
-        thread.daemon = True
-        thread.start()
+            # Parsing and indexing stay on the worker; the UI thread just swaps lists in
+            stations = self.read_stations_cache()
+            if stations is None:
+                stations = self.api.get_stations()
+                # An empty list means the request failed; nothing worth keeping
+                if stations:
+                    self.write_stations_cache(stations)
+            index = index_stations(stations)
+            wx.CallAfter(self.on_stations_loaded, stations, index)
+        
+        self._pool.submit(load)
     
     def on_load_more_stations(self, event):
         """Load more stations based on current filters"""
@@ -415,139 +747,217 @@ class RadioPlayerFrame(wx.Frame):
         
         self.set_status("Loading more stations...")
         self.load_more_btn.Enable(False)
+        epoch = self._req_epoch
         
-        def load():
-            search_text = self.search_ctrl.GetValue()
-            country = self.country_choice.GetStringSelection()
-            language = self.language_choice.GetStringSelection()
-            
-            search_name = search_text if search_text else ""
-            search_country = country if country != "All" else ""
-            search_language = language if language != "All" else ""
-            
-            self.current_offset += self.stations_per_page
-            
-            more_stations = self.api.search_stations(
-                name=search_name,
-                country=search_country,
-                language=search_language,
-                offset=self.current_offset,
-                limit=self.stations_per_page
-            )
-            
-            wx.CallAfter(self.on_more_stations_loaded, more_stations)
-        
-        thread = threading.Thread(target=load)
-        thread.daemon = True
-        thread.start()
+        self.current_offset += self.stations_per_page
+        future = self._take_prefetch(self.current_offset)
+        if future is None:
+            future = self._submit_page(self.current_offset)
+        self._deliver(future, epoch, self.on_more_stations_loaded)
+    
+    def _page_query(self):
+        """Search arguments (name, country, language, continent) for the current filters;
+        read on the UI thread"""
+        search_text = self.search_ctrl.GetValue()
+        country = self.country_choice.GetStringSelection()
+        language = self.language_choice.GetStringSelection()
+        continent = self.continent_choice.GetStringSelection()
+        return (search_text if search_text else "",
+                country if country != "All" else "",
+                language if language != "All" else "",
+                continent if continent in self.continent_map else "")
+    
+    def _submit_page(self, offset):
+        """Start fetching the page of results at offset"""
+        return self._pool.submit(self._fetch_page, *self._page_query(), offset)
+    
+    def _fetch_page(self, name, country, language, continent, offset):
+        """Search one page on the worker; returns (stations, whether the page was full)"""
+        results = self.api.search_stations(name=name, country=country, language=language,
+                                           offset=offset, limit=self.stations_per_page)
+        # Whether there is a next page depends on what the server sent, before the continent filter
+        full = len(results) >= self.stations_per_page
+        # The server can't filter by continent, so that is done here
+        if continent:
+            results = [s for s in results if s.continent == continent]
+        return results, full
     
-    def on_stations_loaded(self):
+    def _prefetch_next_page(self):
+        """Fetch the page after the one shown, so Load More can use it straight away"""
+        offset = self.current_offset + self.stations_per_page
+        self._prefetch = ((self._page_query(), offset), self._submit_page(offset))
+    
+    def _take_prefetch(self, offset):
+        """Return the prefetched page at offset for the current filters, if there is one"""
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch and prefetch[0] == (self._page_query(), offset):
+            return prefetch[1]
+        if prefetch:
+            prefetch[1].cancel()
+        return None
+    
+    def _next_epoch(self):
+        """Start a new station request, making results of earlier ones stale"""
+        self._req_epoch += 1
+        return self._req_epoch
+    
+    def _deliver(self, future, epoch, handler):
+        """Pass the future's result to handler on the UI thread, unless it was cancelled"""
+        def done(f):
+            # After on_close the pool is shut down and the controls are going away
+            if not f.cancelled() and not self._closing:
+                wx.CallAfter(self._apply_if_current, epoch, handler, f.result())
+        future.add_done_callback(done)
+    
+    def _apply_if_current(self, epoch, handler, results):
+        """Pass results to handler unless a newer request has started since, or the window is closing"""
+        if epoch == self._req_epoch and not self._closing:
+            handler(results)
+    
+    def on_stations_loaded(self, stations, index):
         """Called when stations are loaded"""
+        # Filtering may submit a search, which the shut down pool would refuse
+        if self._closing:
+            return
+        self.stations = stations
+        self._station_index = index
         self.load_btn.Enable(True)
         self.current_offset = 0
-        self.apply_filters()
+        # New stations need filtering even with unchanged filters
+        self.apply_filters(force=True)
         self.update_favorites_list()
         self.set_status(f"Loaded {len(self.stations)} stations")
     
-    def on_more_stations_loaded(self, more_stations):
+    def on_more_stations_loaded(self, page):
         """Called when more stations are loaded via pagination"""
+        more_stations, full = page
         self.load_more_btn.Enable(True)
         
-        if more_stations and len(more_stations) > 0:
+        if more_stations or full:
+            # After local matches the server pages repeat the loaded stations that matched
+            shown = {station.url for station in self.filtered_stations}
+            more_stations = [s for s in more_stations if s.url not in shown]
             self.filtered_stations.extend(more_stations)
-            self.has_more_stations = len(more_stations) >= self.stations_per_page
-            self.update_stations_list()
+            self.has_more_stations = full
+            self.load_more_btn.Enable(full)
+            self.update_stations_list(appended=True)
+            if self.has_more_stations:
+                self._prefetch_next_page()
             self.set_status(f"Loaded {len(more_stations)} more stations. Total: {len(self.filtered_stations)}")
         else:
             self.has_more_stations = False
             self.load_more_btn.Enable(False)
             self.set_status("No more stations available")
     
-    def apply_filters(self):
-        """Apply current filters to station list"""
+    def apply_filters(self, force=False):
+        """Apply current filters to station list, unless they are already applied"""
         search_text = self.search_ctrl.GetValue()
         country = self.country_choice.GetStringSelection()
         language = self.language_choice.GetStringSelection()
         continent = self.continent_choice.GetStringSelection()
         
+        filters = (search_text, country, language, continent)
+        if filters == self._last_filters and not force:
+            return
+        self._last_filters = filters
+        
         self.current_offset = 0
         self.has_more_stations = False
         self.load_more_btn.Enable(False)
+        # Requests for the old filters that haven't started yet are not needed
+        if self._prefetch:
+            self._prefetch[1].cancel()
+            self._prefetch = None
+        if self._search_future:
+            self._search_future.cancel()
+        epoch = self._next_epoch()
         
         if search_text or country != "All" or language != "All" or continent != "All":
+            # The loaded top stations often hold enough matches already
+            local = self._filter_loaded_stations(search_text, country, language, continent)
+            if len(local) >= self.LOCAL_FILTER_MIN:
+                self.filtered_stations = local
+                # Only the loaded stations were searched; Load More goes on with the
+                # server's results from their first page
+                self.current_offset = -self.stations_per_page
+                self.has_more_stations = True
+                self.load_more_btn.Enable(True)
+                self.update_stations_list()
+                self.set_status(f"Found {len(local)} matches among the loaded stations "
+                                "(Load More searches all stations)")
+                return
             #self.set_status("Searching stations...")
             
-            def search():
-                search_name = search_text if search_text else ""
-                search_country = country if country != "All" else ""
-                search_language = language if language != "All" else ""
-                
-                results = self.api.search_stations(
-                    name=search_name,
-                    country=search_country,
-                    language=search_language,
-                    offset=0,
-                    limit=self.stations_per_page
-                )
-                
-                # Apply continent filter locally
-                if continent != "All" and continent in self.continent_map:
-                    continent_codes = self.continent_map[continent]
-                    results = [s for s in results if s.countrycode in continent_codes]
-                
-                wx.CallAfter(self.on_filter_results_loaded, results)
-            
-            thread = threading.Thread(target=search)
-            thread.daemon = True
-            thread.start()
+            self._search_future = self._submit_page(0)
+            self._deliver(self._search_future, epoch, self.on_filter_results_loaded)
         else:
             self.filtered_stations = self.stations[:]
             self.update_stations_list()    
     
-    def on_filter_results_loaded(self, results):
+    def _filter_loaded_stations(self, search_text, country, language, continent):
+        """Match the filters against the loaded stations, as the server search would;
+        the country must match exactly, which search_stations asks of the server too"""
+        needle = search_text.lower()
+        language = language.lower()
+        if continent not in self.continent_map:
+            continent = None
+        rows, by_country, by_continent = self._station_index
+        # Only scan the stations of the selected country or continent
+        if country != "All":
+            rows = by_country.get(country, ())
+        elif continent is not None:
+            rows = by_continent.get(continent, ())
+        return [station for station, name, station_country, languages in rows
+                if needle in name
+                and (country == "All" or station_country == country)
+                and (language == "all" or language in languages)
+                and (continent is None or station.continent == continent)]
+    
+    def on_filter_results_loaded(self, page):
         """Called when filter search results are loaded"""
+        results, full = page
         self.filtered_stations = results
-        self.has_more_stations = len(results) >= self.stations_per_page
+        self.has_more_stations = full
         self.load_more_btn.Enable(self.has_more_stations)
         self.update_stations_list()
+        if self.has_more_stations:
+            self._prefetch_next_page()
         
         status_msg = f"Found {len(self.filtered_stations)} stations"
         if self.has_more_stations:
             status_msg += " (more available)"
         self.set_status(status_msg)
     
-    def update_stations_list(self):
+    def update_stations_list(self, appended=False):
         """Update the stations list control"""
-        self.stations_list.DeleteAllItems()
-        for i, station in enumerate(self.filtered_stations):
-            index = self.stations_list.InsertItem(i, station.name)
-            self.stations_list.SetItem(index, 1, station.country)
-            self.stations_list.SetItem(index, 2, station.language)
-            self.stations_list.SetItem(index, 3, f"{station.bitrate} kbps")
+        self.stations_list.refresh(appended=appended)
         
         status_msg = f"Showing {len(self.filtered_stations)} stations"
         if self.has_more_stations:
             status_msg += " (Load More available)"
         self.set_status(status_msg)
     
-    def update_favorites_list(self):
+    def update_favorites_list(self, appended=False):
         """Update the favorites list control"""
-        self.favorites_list.DeleteAllItems()
-        for i, station in enumerate(self.favorites):
-            index = self.favorites_list.InsertItem(i, station.name)
-            self.favorites_list.SetItem(index, 1, station.country)
-            self.favorites_list.SetItem(index, 2, station.language)
-            self.favorites_list.SetItem(index, 3, f"{station.bitrate} kbps")
+        self.favorites_list.refresh(appended=appended)
+    
+    def on_search_text(self, event):
+        """Restart the search delay on each keystroke"""
+        self._search_timer.StartOnce(300)
     
     def on_filter_change(self, event):
         """Handle filter change"""
+        # A pending search would only repeat the filtering done here
+        self._search_timer.Stop()
         if self.stations:
             self.apply_filters()
             self.clear_btn.Enable(True)
     
     def on_clear_filters(self, event):
         """Clear all filters"""
-        self.search_ctrl.SetValue("")
+        self._search_timer.Stop()
+        self.search_ctrl.ChangeValue("")
+        self.api.clear_cache()
         self.country_choice.SetSelection(0)
         self.language_choice.SetSelection(0)
         self.continent_choice.SetSelection(0)
@@ -579,36 +989,13 @@ class RadioPlayerFrame(wx.Frame):
             return
         
         station = self.filtered_stations[index]
-        
-        menu = wx.Menu()
-        play_item = menu.Append(wx.ID_ANY, "Play")
-        add_fav_item = menu.Append(wx.ID_ANY, "Add to Favorites")
-        copy_url_item = menu.Append(wx.ID_ANY, "Copy Stream URL")
-        
-        def on_play(e):
+        choice = self.show_context_menu(self.stations_list, event, self.STATION_MENU)
+        if choice == 0:
             self.play_station(station)
-        
-        def on_add_fav(e):
+        elif choice == 1:
             self.add_to_favorites(station)
-        
-        def on_copy_url(e):
-            if wx.TheClipboard.Open():
-                wx.TheClipboard.SetData(wx.TextDataObject(station.url))
-                wx.TheClipboard.Close()
-                self.set_status(f"Copied URL to clipboard: {station.url}")
-        
-        self.Bind(wx.EVT_MENU, on_play, play_item)
-        self.Bind(wx.EVT_MENU, on_add_fav, add_fav_item)
-        self.Bind(wx.EVT_MENU, on_copy_url, copy_url_item)
-        
-        pos = event.GetPosition()
-        if pos == wx.DefaultPosition:
-            pos = self.stations_list.GetPosition()
-        else:
-            pos = self.stations_list.ScreenToClient(pos)
-        
-        self.stations_list.PopupMenu(menu, pos)
-        menu.Destroy()
+        elif choice == 2:
+            self.copy_stream_url(station)
     
     def on_favorite_context_menu(self, event):
         """Show context menu for favorite"""
@@ -617,37 +1004,38 @@ class RadioPlayerFrame(wx.Frame):
             return
         
         station = self.favorites[index]
-        fav_index = index
-        
-        menu = wx.Menu()
-        play_item = menu.Append(wx.ID_ANY, "Play")
-        remove_item = menu.Append(wx.ID_ANY, "Remove from Favorites")
-        copy_url_item = menu.Append(wx.ID_ANY, "Copy Stream URL")
-        
-        def on_play(e):
+        choice = self.show_context_menu(self.favorites_list, event, self.FAVORITE_MENU)
+        if choice == 0:
             self.play_station(station)
-        
-        def on_remove(e):
-            self.remove_from_favorites(fav_index)
-        
-        def on_copy_url(e):
-            if wx.TheClipboard.Open():
-                wx.TheClipboard.SetData(wx.TextDataObject(station.url))
-                wx.TheClipboard.Close()
-                self.set_status(f"Copied URL to clipboard: {station.url}")
-        
-        self.Bind(wx.EVT_MENU, on_play, play_item)
-        self.Bind(wx.EVT_MENU, on_remove, remove_item)
-        self.Bind(wx.EVT_MENU, on_copy_url, copy_url_item)
+        elif choice == 1:
+            self.remove_from_favorites(index)
+        elif choice == 2:
+            self.copy_stream_url(station)
+    
+    def show_context_menu(self, list_ctrl, event, labels):
+        """Pop up a menu of labels over list_ctrl; return the position of the chosen one, or None"""
+        if labels not in self._context_menus:
+            menu = wx.Menu()
+            ids = [menu.Append(wx.ID_ANY, label).GetId() for label in labels]
+            self._context_menus[labels] = (menu, ids)
+        menu, ids = self._context_menus[labels]
         
         pos = event.GetPosition()
         if pos == wx.DefaultPosition:
-            pos = self.favorites_list.GetPosition()
+            pos = list_ctrl.GetPosition()
         else:
-            pos = self.favorites_list.ScreenToClient(pos)
+            pos = list_ctrl.ScreenToClient(pos)
         
-        self.favorites_list.PopupMenu(menu, pos)
-        menu.Destroy()
+        # The choice is returned instead of sent as an event, so nothing is bound
+        selected = list_ctrl.GetPopupMenuSelectionFromUser(menu, pos)
+        return ids.index(selected) if selected in ids else None
+    
+    def copy_stream_url(self, station):
+        """Put a station's stream URL on the clipboard"""
+        if wx.TheClipboard.Open():
+            wx.TheClipboard.SetData(wx.TextDataObject(station.url))
+            wx.TheClipboard.Close()
+            self.set_status(f"Copied URL to clipboard: {station.url}")
     
     def on_play_stop_toggle(self, event):
         """Toggle play/stop"""
@@ -667,8 +1055,42 @@ class RadioPlayerFrame(wx.Frame):
                     self.current_favorite_index = index
                     self.play_station(self.favorites[index])
     
+    def _ensure_vlc(self):
+        """Create the VLC instance and player if this is the first playback"""
+        if self.vlc_instance is None:
+            # Loading libvlc is slow, so it waits until something is played
+            import vlc
+            self.vlc_instance = vlc.Instance('--no-xlib')
+            self.player = self.vlc_instance.media_player_new()
+            self.player.audio_set_volume(0 if self.is_muted else self.volume)
+    
+    def _watch_for_error(self, media, station):
+        """Report it if media, started now for station, fails to play"""
+        import vlc
+        self._play_id += 1
+        play_id = self._play_id
+        
+        def on_state(event):
+            # Runs on a VLC thread, which must not call back into libvlc
+            if event.u.new_state == vlc.State.Error:
+                wx.CallAfter(self._on_playback_error, station, play_id)
+        
+        # play() returns before the stream is opened; a dead stream only shows up here
+        media.event_manager().event_attach(vlc.EventType.MediaStateChanged, on_state)
+    
+    def _on_playback_error(self, station, play_id):
+        """Report a stream that couldn't be played, unless another one has been started since"""
+        if self._closing or not self.is_playing or play_id != self._play_id:
+            return
+        self.stop_playback()
+        wx.MessageBox(f"Could not play the stream.\n\nStream URL: {station.url}",
+                      "Playback Error", wx.OK | wx.ICON_ERROR)
+        self.set_status(f"Error playing {station.name}")
+    
     def play_station(self, station):
         try:
+            self._ensure_vlc()
+            
             # Stop current playback
             if self.is_playing:
                 self.stop_playback()
@@ -680,6 +1102,7 @@ class RadioPlayerFrame(wx.Frame):
             media = self.vlc_instance.media_new(station.url)
             buffer_size = self.settings.get('buffer_size', 1000)
             media.add_option(f':network-caching={buffer_size}')
+            self._watch_for_error(media, station)
             self.player.set_media(media)
             self.player.play()
             self.is_playing = True
@@ -710,7 +1133,8 @@ class RadioPlayerFrame(wx.Frame):
         """Handle volume slider change"""
         if not self.is_muted:
             self.volume = self.volume_slider.GetValue()
-            self.player.audio_set_volume(self.volume)
+            if self.player:
+                self.player.audio_set_volume(self.volume)
             self.set_status(f"Volume: {self.volume}%")
 
 
@@ -718,11 +1142,13 @@ class RadioPlayerFrame(wx.Frame):
         """Toggle mute"""
         self.is_muted = not self.is_muted
         if self.is_muted:
-            self.player.audio_set_volume(0)
+            if self.player:
+                self.player.audio_set_volume(0)
             self.mute_btn.SetLabel("Un&mute")
             self.set_status("Muted")
         else:
-            self.player.audio_set_volume(self.volume)
+            if self.player:
+                self.player.audio_set_volume(self.volume)
             self.mute_btn.SetLabel("&Mute")
             self.set_status(f"Unmuted - Volume: {self.volume}%")
     
@@ -766,11 +1192,10 @@ class RadioPlayerFrame(wx.Frame):
         if not self.current_station:
             return
         
-        recordings_dir = Path(self.settings.get('recording_dir', str(Path.home() / "RadioRecordings")))
-        recordings_dir.mkdir(parents=True, exist_ok=True)
+        recordings_dir = self.get_recordings_dir()
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = "".join(c for c in self.current_station.name if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_name = safe_filename(self.current_station.name)
         filename = recordings_dir / f"{safe_name}_{timestamp}.mp3"
         
         self.recorder = StreamRecorder(self.current_station.url, str(filename))
@@ -780,6 +1205,16 @@ class RadioPlayerFrame(wx.Frame):
         self.record_btn.SetLabel("⏹ Stop Recording")
         self.set_status(f"Recording to: {filename}")
     
+    def get_recordings_dir(self):
+        """Recording directory from the settings, created the first time it is used"""
+        setting = self.settings.get('recording_dir', str(Path.home() / "RadioRecordings"))
+        # Keyed by the setting, so choosing another directory creates that one
+        if self._recordings_dir is None or self._recordings_dir[0] != setting:
+            path = Path(setting)
+            path.mkdir(parents=True, exist_ok=True)
+            self._recordings_dir = (setting, path)
+        return self._recordings_dir[1]
+    
     def stop_recording(self):
         """Stop recording"""
         if self.recorder:
@@ -792,22 +1227,25 @@ class RadioPlayerFrame(wx.Frame):
     
     def add_to_favorites(self, station):
         """Add station to favorites"""
-        for fav in self.favorites:
-            if fav.url == station.url:
-                wx.MessageBox("Station already in favorites!", "Info", wx.OK | wx.ICON_INFORMATION)
-                return
+        if station.url in self._favorite_urls:
+            wx.MessageBox("Station already in favorites!", "Info", wx.OK | wx.ICON_INFORMATION)
+            return
         
         self.favorites.append(station)
-        self.update_favorites_list()
-        self.save_favorites()
+        self._favorite_urls.add(station.url)
+        self.update_favorites_list(appended=True)
+        self.append_favorite(station)
         self.set_status(f"Added {station.name} to favorites")
     
     def remove_from_favorites(self, index):
         """Remove station from favorites"""
         if 0 <= index < len(self.favorites):
             station = self.favorites.pop(index)
+            # Imported stations may share a URL with another favorite
+            if station.url not in self.favorites.urls():
+                self._favorite_urls.discard(station.url)
             self.update_favorites_list()
-            self.save_favorites()
+            self.schedule_save_favorites()
             self.set_status(f"Removed {station.name} from favorites")
     def on_import_station(self, event):
         dlg = AddStationDialog(self)
@@ -815,60 +1253,93 @@ class RadioPlayerFrame(wx.Frame):
             new_station = dlg.get_station()
             if new_station:
                 self.favorites.append(new_station)
-                self.update_favorites_list()
-                self.save_favorites()
+                self._favorite_urls.add(new_station.url)
+                self.update_favorites_list(appended=True)
+                self.append_favorite(new_station)
                 self.set_status(f"Added new station: {new_station.name}")
         pass
     
     def save_favorites(self):
-        """Save favorites to file"""
-        favorites_file = Path.home() / ".radio_favorites.json"
+        """Rewrite the favorites file from self.favorites"""
         try:
-            data = []
-            for fav in self.favorites:
-                data.append({
-                    'name': fav.name,
-                    'url': fav.url,
-                    'country': fav.country,
-                    'countrycode': fav.countrycode,
-                    'state': fav.state,
-                    'language': fav.language,
-                    'bitrate': fav.bitrate,
-                    'codec': fav.codec,
-                    'tags': fav.tags,
-                    'favicon': fav.favicon,
-                    'geo_lat': fav.geo_lat,
-                    'geo_long': fav.geo_long
-                })
-            
-            with open(favorites_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            records = self.favorites.records(favorite_record)
+            payload = b"".join(json_line(record) for record in records)
+            # Nothing to write if the file already holds exactly this
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._favorites_digest:
+                return
+            write_atomic(FAVORITES_FILE, payload)
+            self._favorites_digest = digest
         except Exception as e:
-            print(f"Error saving favorites: {e}")
+            log.warning("Error saving favorites: %s", e)
+    
+    def schedule_save_favorites(self):
+        """Save favorites once edits pause for FAVORITES_SAVE_DELAY ms"""
+        if self._save_call is None:
+            self._save_call = wx.CallLater(self.FAVORITES_SAVE_DELAY, self.flush_favorites)
+        else:
+            self._save_call.Restart(self.FAVORITES_SAVE_DELAY)
+    
+    def flush_favorites(self):
+        """Write a scheduled favorites save now, if one is pending"""
+        if self._save_call is not None:
+            self._save_call.Stop()
+            self._save_call = None
+            self.save_favorites()
+    
+    def append_favorite(self, station):
+        """Add one station to the end of the favorites file"""
+        try:
+            self._favorites_digest = None
+            with open(FAVORITES_FILE, 'ab') as f:
+                f.write(json_line(favorite_record(station)))
+        except Exception as e:
+            log.warning("Error saving favorites: %s", e)
     
     def load_favorites(self):
         """Load favorites from file"""
-        favorites_file = Path.home() / ".radio_favorites.json"
-        if favorites_file.exists():
-            try:
-                with open(favorites_file, 'r') as f:
-                    data = json.load(f)
-                    self.favorites = [RadioStation(item) for item in data]
-                    if hasattr(self, 'favorites_list'):
-                        self.update_favorites_list()
-            except Exception as e:
-                print(f"Error loading favorites: {e}")
+        try:
+            if FAVORITES_FILE.exists():
+                records = []
+                damaged = False
+                with open(FAVORITES_FILE, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            records.append(orjson.loads(line) if orjson else json.loads(line))
+                        except ValueError:
+                            # A write cut short leaves a partial last line
+                            log.warning("Skipping unreadable favorite: %r", line[:80])
+                            damaged = True
+                # Stations are only built when the list shows or plays them
+                self.favorites = LazyStationList(records)
+                # Rewrite so later appends don't land on the end of the bad line
+                if damaged:
+                    self.save_favorites()
+            elif LEGACY_FAVORITES_FILE.exists():
+                self.favorites = LazyStationList(read_json(LEGACY_FAVORITES_FILE))
+                self.save_favorites()
+            else:
+                return
+            self._favorite_urls = set(self.favorites.urls())
+            if hasattr(self, 'favorites_list'):
+                self.update_favorites_list()
+        except Exception as e:
+            log.warning("Error loading favorites: %s", e)
+    
     def on_handle_key_press(self, event: wx.KeyEvent):
         """Handle key press events for accessibility"""
         keycode = event.GetKeyCode()
-        if keycode == wx.WXK_F1:
+        # These shortcuts are only for screen reader users; every other key passes straight on
+        if keycode not in (wx.WXK_F1, wx.WXK_F2, wx.WXK_F3) or not self.tts:
+            event.Skip()
+        elif keycode == wx.WXK_F1:
             self.on_about(None)
         elif keycode==wx.WXK_F2:
-            o.output(f"{len(self.favorites)} are in favourites")
+            self.speak(f"{len(self.favorites)} are in favourites")
         elif keycode == wx.WXK_F3:
-            o.output(self.GetStatusBar().GetStatusText())
-        else:
-            event.Skip()
+            self.speak(self.GetStatusBar().GetStatusText())
 
 if __name__ == '__main__':
     app = wx.App()
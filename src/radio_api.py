@@ -1,15 +1,65 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import socket
 import json
 import urllib.request
 import random
 import math
+import threading
+import sys
+import time
+import logging
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import MutableSequence
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Map continents to country codes
+_CONTINENT_CODES = {
+    'Africa': ['DZ', 'AO', 'BJ', 'BW', 'BF', 'BI', 'CM', 'CV', 'CF', 'TD', 'KM', 'CG', 'CD', 'CI', 'DJ', 'EG', 'GQ', 'ER', 'ET', 'GA', 'GM', 'GH', 'GN', 'GW', 'KE', 'LS', 'LR', 'LY', 'MG', 'MW', 'ML', 'MR', 'MU', 'YT', 'MA', 'MZ', 'NA', 'NE', 'NG', 'RE', 'RW', 'SH', 'ST', 'SN', 'SC', 'SL', 'SO', 'ZA', 'SS', 'SD', 'SZ', 'TZ', 'TG', 'TN', 'UG', 'EH', 'ZM', 'ZW'],
+    'Asia': ['AF', 'AM', 'AZ', 'BH', 'BD', 'BT', 'BN', 'KH', 'CN', 'GE', 'HK', 'IN', 'ID', 'IR', 'IQ', 'IL', 'JP', 'JO', 'KZ', 'KW', 'KG', 'LA', 'LB', 'MO', 'MY', 'MV', 'MN', 'MM', 'NP', 'KP', 'OM', 'PK', 'PS', 'PH', 'QA', 'SA', 'SG', 'KR', 'LK', 'SY', 'TW', 'TJ', 'TH', 'TL', 'TR', 'TM', 'AE', 'UZ', 'VN', 'YE'],
+    'Europe': ['AX', 'AL', 'AD', 'AT', 'BY', 'BE', 'BA', 'BG', 'HR', 'CY', 'CZ', 'DK', 'EE', 'FO', 'FI', 'FR', 'DE', 'GI', 'GR', 'GG', 'HU', 'IS', 'IE', 'IM', 'IT', 'JE', 'XK', 'LV', 'LI', 'LT', 'LU', 'MK', 'MT', 'MD', 'MC', 'ME', 'NL', 'NO', 'PL', 'PT', 'RO', 'RU', 'SM', 'RS', 'SK', 'SI', 'ES', 'SJ', 'SE', 'CH', 'UA', 'GB', 'VA'],
+    'North America': ['AI', 'AG', 'AW', 'BS', 'BB', 'BZ', 'BM', 'BQ', 'VG', 'CA', 'KY', 'CR', 'CU', 'CW', 'DM', 'DO', 'SV', 'GL', 'GD', 'GP', 'GT', 'HT', 'HN', 'JM', 'MQ', 'MX', 'MS', 'NI', 'PA', 'PM', 'PR', 'BL', 'KN', 'LC', 'MF', 'VC', 'SX', 'TT', 'TC', 'US', 'VI'],
+    'South America': ['AR', 'BO', 'BR', 'CL', 'CO', 'EC', 'FK', 'GF', 'GY', 'PY', 'PE', 'SR', 'UY', 'VE'],
+    'Oceania': ['AS', 'AU', 'CK', 'FJ', 'PF', 'GU', 'KI', 'MH', 'FM', 'NR', 'NC', 'NZ', 'NU', 'NF', 'MP', 'PW', 'PG', 'PN', 'WS', 'SB', 'TK', 'TO', 'TV', 'VU', 'WF'],
+    'Antarctica': ['AQ', 'BV', 'TF', 'HM', 'GS']
+}
+CONTINENT_COUNTRIES = {name: frozenset(codes) for name, codes in _CONTINENT_CODES.items()}
+# Reverse lookup, country code -> continent name
+COUNTRY_CONTINENT = {code: name for name, codes in _CONTINENT_CODES.items() for code in codes}
+
+# Server URLs found by the first successful lookup, reused for the rest of the run
+_server_urls = []
+
+def _host_name(ip):
+    """Reverse DNS name of ip, or None if it has none"""
+    try:
+        return socket.gethostbyaddr(ip)[0]
+    except socket.herror:
+        return None
+
+def _intern(value):
+    """sys.intern for strings, anything else unchanged"""
+    return sys.intern(value) if type(value) is str else value
+
 class RadioStation:
+    # Thousands are held at once; slots keep them small and attribute reads fast
+    __slots__ = ('source', 'name', 'url', 'country', 'countrycode', 'state', 'language',
+                 'tags', 'favicon', 'bitrate', 'codec', 'geo_lat', 'geo_long',
+                 'location', 'bitrate_label', 'continent')
+    
     def __init__(self, data, source="radiobrowser"):
         self.source = source
         if source == "radiobrowser":
             self.name = data.get('name', 'Unknown')
-            self.url = data.get('url_resolved', data.get('url', ''))
+            self.url = self.stream_url(data)
             self.country = data.get('country', 'Unknown')
             self.countrycode = data.get('countrycode', '')
             self.state = data.get('state', '')
@@ -20,14 +70,8 @@ class RadioStation:
             self.codec = data.get('codec', 'Unknown')
             self.geo_lat = data.get('geo_lat', None)
             self.geo_long = data.get('geo_long', None)
-            
-            # Build location string
-            location_parts = []
-            if self.state:
-                location_parts.append(self.state)
-            if self.country and self.country != 'Unknown':
-                location_parts.append(self.country)
-            self.location = ', '.join(location_parts) if location_parts else 'Unknown'
+            self._intern_shared_fields()
+            self._set_location()
             
         else:  # onlineradiobox
             self.name = data.get('name', 'Unknown')
@@ -43,86 +87,229 @@ class RadioStation:
             self.geo_lat = None
             self.geo_long = None
             self.location = self.country
+            self.continent = None
+        
+        # Shown by the station lists on every repaint, so format it once
+        self.bitrate_label = f"{self.bitrate} kbps"
+    
+    # Radio Browser record fields copied as they are, in __init__ order
+    _RECORD_FIELDS = itemgetter('name', 'country', 'countrycode', 'state', 'language', 'tags',
+                                'favicon', 'bitrate', 'codec', 'geo_lat', 'geo_long')
+    
+    @classmethod
+    def from_record(cls, data):
+        """Build a Radio Browser station, skipping the per-field defaults when none are needed"""
+        try:
+            values = cls._RECORD_FIELDS(data)
+        except KeyError:
+            return cls(data)
+        station = object.__new__(cls)
+        station.source = "radiobrowser"
+        (station.name, station.country, station.countrycode, station.state, station.language,
+         station.tags, station.favicon, station.bitrate, station.codec, station.geo_lat,
+         station.geo_long) = values
+        station.url = cls.stream_url(data)
+        station._intern_shared_fields()
+        station._set_location()
+        station.bitrate_label = f"{station.bitrate} kbps"
+        return station
+    
+    def _intern_shared_fields(self):
+        """Share one string object between stations for fields with few distinct values"""
+        self.country = _intern(self.country)
+        self.countrycode = _intern(self.countrycode)
+        self.language = _intern(self.language)
+        self.codec = _intern(self.codec)
+    
+    def _set_location(self):
+        """Build the location string from state and country, and look up the continent"""
+        # Looked up once here instead of by every continent filter
+        self.continent = COUNTRY_CONTINENT.get(self.countrycode)
+        location_parts = []
+        if self.state:
+            location_parts.append(self.state)
+        if self.country and self.country != 'Unknown':
+            location_parts.append(self.country)
+        self.location = ', '.join(location_parts) if location_parts else 'Unknown'
         
     def __str__(self):
         return f"{self.name} - {self.country}"
+    
+    @staticmethod
+    def stream_url(data):
+        """URL a Radio Browser station record plays from"""
+        return data.get('url_resolved', data.get('url', ''))
+
+class LazyStationList(MutableSequence):
+    """List of stations kept as their raw records until each one is first read"""
+    def __init__(self, records=()):
+        # Each entry is a record dict or the RadioStation built from it
+        self._items = list(records)
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if not isinstance(item, RadioStation):
+            item = self._items[index] = RadioStation.from_record(item)
+        return item
+    
+    def __setitem__(self, index, station):
+        self._items[index] = station
+    
+    def __delitem__(self, index):
+        del self._items[index]
+    
+    def insert(self, index, station):
+        self._items.insert(index, station)
+    
+    def urls(self):
+        """Stream URLs of all stations, without building the unread ones"""
+        return [item.url if isinstance(item, RadioStation) else RadioStation.stream_url(item)
+                for item in self._items]
+    
+    def records(self, to_record):
+        """Records of all stations; to_record converts the ones already built"""
+        return [to_record(item) if isinstance(item, RadioStation) else item
+                for item in self._items]
 
 class RadioBrowserAPI:
+    # Seconds a cached response stays valid
+    SEARCH_TTL = 15 * 60
+    LIST_TTL = 24 * 3600
+    SEARCH_CACHE_SIZE = 128
+    # Server lookups tried before settling on FALLBACK_SERVER
+    SERVER_LOOKUP_ATTEMPTS = 3
+    FALLBACK_SERVER = "https://de1.api.radio-browser.info"
+    
     def __init__(self):
         self.base_url = None
         self.on_servers_set = None
+        # Kept-alive connections to the API server, reused by every search and lookup
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'RadioBrowserPlayer/1.0',
+            'Accept': 'application/json'
+        })
+        # {key: (expiry, result)}, shared by the background worker threads
+        self._cache = {}
+        self._cache_lock = threading.Lock()
         #self._get_base_url()
     
+    def close(self):
+        """Close the pooled connections"""
+        self.session.close()
+    
+    def clear_cache(self):
+        """Forget all cached responses"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _cached(self, key, ttl, fetch):
+        """Return fetch() through the response cache, keeping empty results out of it"""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.pop(key, None)
+            if entry and entry[0] > now:
+                # Re-insert so dict order stays least-recently-used first
+                self._cache[key] = entry
+                return list(entry[1])
+        
+        result = fetch()
+        if result:
+            with self._cache_lock:
+                self._cache[key] = (now + ttl, result)
+                while len(self._cache) > self.SEARCH_CACHE_SIZE:
+                    del self._cache[next(iter(self._cache))]
+        # Callers extend the lists they get, so never hand out the cached one
+        return list(result)
+    
     def _get_radiobrowser_base_urls(self):
         """Get all base urls of all currently available radiobrowser servers"""
-        hosts = []
+        if _server_urls:
+            return list(_server_urls)
         try:
-            ips = socket.getaddrinfo('all.api.radio-browser.info', 80, 0, 0, socket.IPPROTO_TCP)
-            for ip_tuple in ips:
-                ip = ip_tuple[4][0]
-                try:
-                    host_addr = socket.gethostbyaddr(ip)
-                    if host_addr[0] not in hosts:
-                        hosts.append(host_addr[0])
-                except socket.herror:
-                    continue
-            
-            hosts.sort()
-            return ["https://" + host for host in hosts]
+            ips = {ip_tuple[4][0] for ip_tuple in
+                   socket.getaddrinfo('all.api.radio-browser.info', 80, 0, 0, socket.IPPROTO_TCP)}
+            # Reverse lookups are slow and independent, so run them side by side
+            with ThreadPoolExecutor(max_workers=min(8, len(ips) or 1)) as pool:
+                hosts = sorted({host for host in pool.map(_host_name, ips) if host})
+            _server_urls[:] = ["https://" + host for host in hosts]
+            return list(_server_urls)
         except Exception as e:
-            print(f"Error getting server list: {e}")
+            log.warning("Error getting server list: %s", e)
             return []
     
     def _get_base_url(self):
         """Get a random server from available servers"""
-        servers = self._get_radiobrowser_base_urls()
-        if servers:
-            self.base_url = random.choice(servers)
+        servers = []
+        for attempt in range(self.SERVER_LOOKUP_ATTEMPTS):
+            servers = self._get_radiobrowser_base_urls()
+            if servers:
+                break
+            if attempt + 1 < self.SERVER_LOOKUP_ATTEMPTS:
+                time.sleep(0.5)
+        self.base_url = random.choice(servers) if servers else self.FALLBACK_SERVER
+        if self.on_servers_set:
             self.on_servers_set(f"Using server: {self.base_url}")
-        else:
-            self._get_base_url()
     
     def _make_request(self, path, params=None, data=None):
         """Make a request to the API with proper headers"""
         url = f"{self.base_url}{path}"
-        headers = {
-            'User-Agent': 'RadioBrowserPlayer/1.0',
-            'Content-Type': 'application/json'
-        }
         
         try:
             if data:
-                response = requests.post(url, json=data, headers=headers, timeout=10)
+                response = self.session.post(url, json=data, timeout=10)
             else:
-                response = requests.get(url, params=params, headers=headers, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
-                return response.json()
+                # orjson parses the raw bytes directly; it's optional
+                return orjson.loads(response.content) if orjson else response.json()
         except Exception as e:
-            print(f"Request error for {url}: {e}")
+            log.warning("Request error for %s: %s", url, e)
         return None
     
-    def _remove_duplicates_keep_highest_bitrate(self, stations):
-        """Keep only one station per name — the one with the highest bitrate"""
+    def _remove_duplicates_keep_highest_bitrate(self, records):
+        """Build one station per name from API records — the one with the highest bitrate"""
         best = {}
-        for s in stations:
-            if s.name not in best or s.bitrate > best[s.name].bitrate:
-                best[s.name] = s
-        return list(best.values())
+        # One pass in response order, so the result stays sorted by votes
+        for record in records:
+            name = record.get('name', 'Unknown')
+            kept = best.get(name)
+            if kept is None or record.get('bitrate', 0) > kept.get('bitrate', 0):
+                best[name] = record
+        # Duplicates are dropped as plain dicts; only the kept records become stations
+        return [RadioStation.from_record(record) for record in best.values()]
 
     def get_stations(self, limit=1000):
         """Get top stations by vote count"""
+        return self._cached(('topvote', limit), self.SEARCH_TTL,
+                            lambda: self._fetch_stations(limit))
+    
+    def _fetch_stations(self, limit):
         try:
             data = self._make_request(f"/json/stations/topvote/{limit}")
             if data:
-                stations = [RadioStation(station) for station in data]
-                return self._remove_duplicates_keep_highest_bitrate(stations)
+                return self._remove_duplicates_keep_highest_bitrate(data)
         except Exception as e:
-            print(f"Error fetching stations: {e}")
+            log.warning("Error fetching stations: %s", e)
         return []
     
     def search_stations(self, name="", country="", language="", offset=0, limit=1000):
         """Search stations by name, country, or language with pagination"""
+        key = ('search', name.lower(), country, language, offset, limit)
+        return self._cached(key, self.SEARCH_TTL,
+                            lambda: self._fetch_search(name, country, language, offset, limit))
+    
+    def _fetch_search(self, name, country, language, offset, limit):
         try:
             params = {
                 'offset': offset,
@@ -133,49 +320,47 @@ class RadioBrowserAPI:
             if name:
                 params['name'] = name
             if country:
+                # Country names come from get_countries, so match them whole: "Niger" isn't "Nigeria"
                 params['country'] = country
+                params['countryExact'] = 'true'
             if language:
                 params['language'] = language
             
             data = self._make_request("/json/stations/search", params=params)
             if data:
-                return self._remove_duplicates_keep_highest_bitrate([RadioStation(station) for station in data])
+                return self._remove_duplicates_keep_highest_bitrate(data)
         except Exception as e:
-            print(f"Error searching stations: {e}")
+            log.warning("Error searching stations: %s", e)
         return []
     
     def get_countries(self):
         """Get list of countries"""
+        return self._cached(('countries',), self.LIST_TTL, self._fetch_countries)
+    
+    def _fetch_countries(self):
         try:
             data = self._make_request("/json/countries")
             if data:
                 return sorted([c['name'] for c in data if c.get('name')])
         except Exception as e:
-            print(f"Error fetching countries: {e}")
+            log.warning("Error fetching countries: %s", e)
         return []
     
     def get_languages(self):
         """Get list of languages"""
+        return self._cached(('languages',), self.LIST_TTL, self._fetch_languages)
+    
+    def _fetch_languages(self):
         try:
             data = self._make_request("/json/languages")
             if data:
                 return sorted([l['name'] for l in data if l.get('name')])
         except Exception as e:
-            print(f"Error fetching languages: {e}")
+            log.warning("Error fetching languages: %s", e)
         return []
     
     def get_continents(self):
-        """Get list of continents based on country codes"""
-        # Map continents to country codes
-        continents = {
-            'Africa': ['DZ', 'AO', 'BJ', 'BW', 'BF', 'BI', 'CM', 'CV', 'CF', 'TD', 'KM', 'CG', 'CD', 'CI', 'DJ', 'EG', 'GQ', 'ER', 'ET', 'GA', 'GM', 'GH', 'GN', 'GW', 'KE', 'LS', 'LR', 'LY', 'MG', 'MW', 'ML', 'MR', 'MU', 'YT', 'MA', 'MZ', 'NA', 'NE', 'NG', 'RE', 'RW', 'SH', 'ST', 'SN', 'SC', 'SL', 'SO', 'ZA', 'SS', 'SD', 'SZ', 'TZ', 'TG', 'TN', 'UG', 'EH', 'ZM', 'ZW'],
-            'Asia': ['AF', 'AM', 'AZ', 'BH', 'BD', 'BT', 'BN', 'KH', 'CN', 'GE', 'HK', 'IN', 'ID', 'IR', 'IQ', 'IL', 'JP', 'JO', 'KZ', 'KW', 'KG', 'LA', 'LB', 'MO', 'MY', 'MV', 'MN', 'MM', 'NP', 'KP', 'OM', 'PK', 'PS', 'PH', 'QA', 'SA', 'SG', 'KR', 'LK', 'SY', 'TW', 'TJ', 'TH', 'TL', 'TR', 'TM', 'AE', 'UZ', 'VN', 'YE'],
-            'Europe': ['AX', 'AL', 'AD', 'AT', 'BY', 'BE', 'BA', 'BG', 'HR', 'CY', 'CZ', 'DK', 'EE', 'FO', 'FI', 'FR', 'DE', 'GI', 'GR', 'GG', 'HU', 'IS', 'IE', 'IM', 'IT', 'JE', 'XK', 'LV', 'LI', 'LT', 'LU', 'MK', 'MT', 'MD', 'MC', 'ME', 'NL', 'NO', 'PL', 'PT', 'RO', 'RU', 'SM', 'RS', 'SK', 'SI', 'ES', 'SJ', 'SE', 'CH', 'UA', 'GB', 'VA'],
-            'North America': ['AI', 'AG', 'AW', 'BS', 'BB', 'BZ', 'BM', 'BQ', 'VG', 'CA', 'KY', 'CR', 'CU', 'CW', 'DM', 'DO', 'SV', 'GL', 'GD', 'GP', 'GT', 'HT', 'HN', 'JM', 'MQ', 'MX', 'MS', 'NI', 'PA', 'PM', 'PR', 'BL', 'KN', 'LC', 'MF', 'VC', 'SX', 'TT', 'TC', 'US', 'VI'],
-            'South America': ['AR', 'BO', 'BR', 'CL', 'CO', 'EC', 'FK', 'GF', 'GY', 'PY', 'PE', 'SR', 'UY', 'VE'],
-            'Oceania': ['AS', 'AU', 'CK', 'FJ', 'PF', 'GU', 'KI', 'MH', 'FM', 'NR', 'NC', 'NZ', 'NU', 'NF', 'MP', 'PW', 'PG', 'PN', 'WS', 'SB', 'TK', 'TO', 'TV', 'VU', 'WF'],
-            'Antarctica': ['AQ', 'BV', 'TF', 'HM', 'GS']
-        }
-        return continents
+        """Get continents mapped to the set of their country codes"""
+        return CONTINENT_COUNTRIES
     def get_continents_list(self):
         return list(self.get_continents().keys())
\ No newline at end of file
@@ -1,6 +1,14 @@
 import threading
 import urllib.request
+import logging
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 class StreamRecorder(threading.Thread):
+    # Most bytes taken from the socket per read
+    CHUNK_SIZE = 256 * 1024
+    
     def __init__(self, url, filename):
         super().__init__()
         self.url = url
@@ -12,14 +20,18 @@ class StreamRecorder(threading.Thread):
         try:
             req = urllib.request.Request(self.url, headers={'User-Agent': 'RadioBrowserPlayer/1.0'})
             with urllib.request.urlopen(req, timeout=10) as response:
+                # Buffered, so every write stores the whole chunk; chunks larger
+                # than the buffer are passed straight through to the file anyway
                 with open(self.filename, 'wb') as f:
                     while self.recording:
-                        chunk = response.read(8192)
+                        # read1 returns what has arrived instead of waiting for a full chunk,
+                        # so stop() still takes effect promptly on slow streams
+                        chunk = response.read1(self.CHUNK_SIZE)
                         if not chunk:
                             break
                         f.write(chunk)
         except Exception as e:
-            print(f"Recording error: {e}")
+            log.warning("Recording error: %s", e)
     
     def stop(self):
         self.recording = False
@@ -0,0 +1,84 @@
+"""
+Finish installing an update once the running application has exited.
+
+AppUpdater starts this with the id of its own process, the downloaded
+executable and the executable it replaces:
+
+    python update_helper.py <pid> <source> <target>
+
+Frozen builds have no interpreter to run this file, so the downloaded
+executable is started with HELPER_FLAG and hands its arguments to main().
+"""
+import os
+import sys
+import shutil
+import subprocess
+from typing import List, Optional
+import psutil
+
+# First argument that puts the application into helper mode
+HELPER_FLAG = "--apply-update"
+
+# Seconds to wait for the application to close before giving up
+EXIT_TIMEOUT = 30
+
+
+def wait_for_exit(pid: int, timeout: float = EXIT_TIMEOUT) -> bool:
+    """Block until process pid has exited. Returns False on timeout."""
+    try:
+        psutil.Process(pid).wait(timeout)
+    except psutil.NoSuchProcess:
+        pass
+    except psutil.TimeoutExpired:
+        return False
+    return True
+
+
+# MoveFileExW flags
+MOVEFILE_REPLACE_EXISTING = 0x1
+MOVEFILE_COPY_ALLOWED = 0x2
+MOVEFILE_WRITE_THROUGH = 0x8
+
+
+def _move_file_windows(source: str, target: str):
+    """Replace target with one MoveFileExW call, flushed before it returns."""
+    import ctypes
+    flags = MOVEFILE_REPLACE_EXISTING | MOVEFILE_COPY_ALLOWED | MOVEFILE_WRITE_THROUGH
+    if not ctypes.windll.kernel32.MoveFileExW(source, target, flags):
+        raise ctypes.WinError()
+
+
+def replace_file(source: str, target: str):
+    """Move source over target, renaming in place when both are on one volume."""
+    try:
+        if os.name == 'nt':
+            _move_file_windows(source, target)
+        else:
+            os.replace(source, target)
+    except OSError:
+        # Different volumes (or source still running on Windows): copy instead,
+        # the leftover is swept with the rest of the update temp files
+        shutil.copy2(source, target)
+    if os.name != 'nt':
+        os.chmod(target, 0o755)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point, argv being [pid, source, target]."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) != 3:
+        print("usage: update_helper.py <pid> <source> <target>", file=sys.stderr)
+        return 2
+
+    pid, source, target = int(argv[0]), argv[1], argv[2]
+    if not wait_for_exit(pid):
+        return 1
+
+    replace_file(source, target)
+    subprocess.Popen([target], start_new_session=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())